@@ -0,0 +1,82 @@
+"""Toffoli savings of coset representation in LYY2021 modular arithmetic.
+
+Compares ModAdd, ModMulByConstFast and ModExpWindowed with their coset
+variants. Padding is the smallest one for which the deviation bound (upper
+bound on probability of wrong result) is below MAX_ERROR.
+
+Run from the resource_estimate directory:
+    python coset_comparison.py
+"""
+
+import pandas as pd
+import qsharp
+
+import re_utils
+
+LYY = "QuantumArithmetic.LYY2021"
+MAX_ERROR = 1e-3
+
+
+def toffolis(counts) -> int:
+    return counts["cczCount"] + counts["ccixCount"]
+
+
+def mod_exp_padding(n, window, mul_window, max_error=MAX_ERROR) -> tuple:
+    """Smallest padding with deviation bound below max_error, and the bound."""
+    padding = 1
+    while True:
+        bound = qsharp.eval(f"{LYY}.CosetDeviationBound("
+                            f"{n},{n},{window},{mul_window},{padding})")
+        if bound <= max_error:
+            return padding, bound
+        padding += 1
+
+
+def compare_inner_ops(n_range, max_error=MAX_ERROR) -> pd.DataFrame:
+    """ModAdd and ModMulByConstFast vs coset variants (deviation 2^-padding
+    per addition)."""
+    rows = []
+    for n in n_range:
+        N, A = 2**n - 1, 2**(n - 1) + 1
+        for name, adds, op, coset_op in [
+            ("ModAdd", 1, f"{LYY}.ModAdd(a, b, {N}L)",
+             f"{LYY}.CosetModAdd(a, c, {N}L)"),
+            ("ModMulByConstFast", n, f"{LYY}.ModMulByConstFast(a, b, {A}L, {N}L)",
+             f"{LYY}.CosetModMulByConstFast(a, c, {A}L, {N}L)"),
+        ]:
+            padding = 1
+            while adds / 2**padding > max_error:
+                padding += 1
+            base = qsharp.logical_counts(
+                f"EstimateUtils.Run3WayOp({n},{n},0,(a, b, _) => {op})")
+            coset = qsharp.logical_counts(
+                f"EstimateUtils.Run3WayOp({n},0,{n + padding},(a, _, c) => {coset_op})")
+            rows.append([n, name, padding, adds / 2**padding, toffolis(base),
+                         toffolis(coset), 1 - toffolis(coset) / toffolis(base)])
+    return pd.DataFrame(rows, columns=["n", "Op", "Padding", "Error bound",
+                                       "Toffolis", "Coset Toffolis", "Savings"])
+
+
+def compare_mod_exp(n_range, windows, mul_window=4, max_error=MAX_ERROR) -> pd.DataFrame:
+    rows = []
+    for n in n_range:
+        for window in windows:
+            padding, bound = mod_exp_padding(n, window, mul_window, max_error)
+            base = re_utils.logical_counts_with_caching(
+                "RunModExp", f"{LYY}.ModExpWindowed(_,_,_,_,{window})", n)
+            coset = re_utils.logical_counts_with_caching(
+                "RunModExp", f"{LYY}.ModExpWindowedCoset(_,_,_,_,{window},"
+                f"{mul_window},{padding})", n)
+            rows.append([n, window, padding, bound, toffolis(base),
+                         toffolis(coset), 1 - toffolis(coset) / toffolis(base),
+                         base["numQubits"], coset["numQubits"]])
+    return pd.DataFrame(rows, columns=[
+        "n", "Window", "Padding", "Error bound", "Toffolis", "Coset Toffolis",
+        "Savings", "Qubits", "Coset qubits"])
+
+
+if __name__ == "__main__":
+    qsharp.init(project_root="../lib/")
+    pd.set_option("display.width", 200)
+    print(compare_inner_ops([16, 64, 256]).to_string(index=False))
+    print(compare_mod_exp([16, 32, 64], [2, 4, 6]).to_string(index=False))
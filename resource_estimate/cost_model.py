@@ -0,0 +1,206 @@
+"""Cost models that predict resource estimates without running the estimator.
+
+Two kinds of models are supported:
+  * Closed-form formulas for logical counts (as returned by
+    `qsharp.logical_counts`), known from the structure of the algorithm.
+    They are exact for n >= min_n, and `check_closed_form` verifies that.
+  * Fitted models for metrics in the results CSVs (see re_utils.METRICS).
+    Several families of formulas are fitted to the points with smaller n, and
+    the one that best predicts the points with largest n is chosen. The
+    maximal relative error on these held-out points is the model's stated
+    error bound.
+
+Example:
+    models = fit_models("estimate_resources_multiply", min_n=16)
+    model = models[("QuantumArithmetic.MCT2017.Multiply", "Logical depth")]
+    print(model.formula, model.max_rel_error, model.predict(1000))
+"""
+
+import math
+from dataclasses import dataclass
+from typing import Callable
+
+import numpy as np
+import pandas as pd
+
+from re_utils import METRICS
+
+# Basis functions of the linear families of fitted models.
+_BASES = {
+    "n": lambda n: n,
+    "log2(n)": np.log2,
+    "sqrt(n)": np.sqrt,
+    "n*log2(n)": lambda n: n * np.log2(n),
+    "n^2": lambda n: n**2,
+    "n^2*log2(n)": lambda n: n**2 * np.log2(n),
+    "n^3": lambda n: n**3,
+}
+_LINEAR_FAMILIES = [
+    ["n"],
+    ["n", "log2(n)"],
+    # Logical qubits after layout are 2Q+sqrt(8Q)+1 for Q algorithm qubits.
+    ["n", "sqrt(n)"],
+    ["n", "sqrt(n)", "log2(n)"],
+    ["n", "n*log2(n)"],
+    ["n", "n^2"],
+    ["n", "n*log2(n)", "n^2"],
+    ["n", "n^2", "n^2*log2(n)"],
+    ["n", "n^2", "n^3"],
+]
+
+
+@dataclass
+class ClosedForm:
+    formula: str
+    func: Callable[[int], int]
+    min_n: int = 1
+
+
+# Closed-form logical counts, keyed by (op, entry point, logical count name).
+CLOSED_FORMS = {
+    ("QuantumArithmetic.LAInc.IncrementByFlip", "RunUnaryOp", "numQubits"):
+        ClosedForm("n + 2*ceil(log2(n+2)) - 1",
+                   lambda n: n + 2 * math.ceil(math.log2(n + 2)) - 1),
+    ("QuantumArithmetic.CDKM2004.Add", "RunBinaryOpInPlace", "numQubits"):
+        ClosedForm("2*n + 1", lambda n: 2 * n + 1, min_n=2),
+    ("QuantumArithmetic.CDKM2004.Add", "RunBinaryOpInPlace", "cczCount"):
+        ClosedForm("2*n - 3", lambda n: 2 * n - 3, min_n=5),
+}
+
+
+def check_closed_form(op, entry_point, count_name, n_range) -> list:
+    """Compares closed form with `qsharp.logical_counts`.
+
+    Returns list of (n, predicted, actual) where they differ.
+    """
+    import qsharp
+    model = CLOSED_FORMS[(op, entry_point, count_name)]
+    mismatches = []
+    for n in n_range:
+        if n < model.min_n:
+            continue
+        counts = qsharp.logical_counts(f"EstimateUtils.{entry_point}({n},{op})")
+        if model.func(n) != counts[count_name]:
+            mismatches.append((n, model.func(n), counts[count_name]))
+    return mismatches
+
+
+@dataclass
+class FittedModel:
+    formula: str
+    predict: Callable[[np.ndarray], np.ndarray]
+    # Maximal relative error on held-out points, i.e. when extrapolating.
+    max_rel_error: float
+    # Range of n in the data. Predictions are less reliable outside of it.
+    min_n: int
+    max_n: int
+
+
+def _fit_power(n, y):
+    (a, b), _, _, _ = np.linalg.lstsq(
+        np.stack([np.ones_like(n), np.log(n)], axis=1), np.log(y), rcond=None)
+    return ("%.4e * n^%.4f" % (np.exp(a), b),
+            lambda m: np.exp(a) * np.asarray(m, dtype=float)**b)
+
+
+def _fit_linear(n, y, family):
+    basis = [np.ones_like(n)] + [_BASES[f](n) for f in family]
+    # Weights make the fit minimize relative error.
+    coefs, _, _, _ = np.linalg.lstsq(
+        np.stack(basis, axis=1) / y[:, None], np.ones_like(y), rcond=None)
+    terms = ["%.4g" % coefs[0]] + \
+        ["%.4g*%s" % (c, f) for c, f in zip(coefs[1:], family)]
+
+    def predict(m):
+        m = np.asarray(m, dtype=float)
+        return coefs[0] + sum(c * _BASES[f](m) for c, f in zip(coefs[1:], family))
+    return " + ".join(terms), predict
+
+
+def fit_metric(n, y, holdout=0.25) -> FittedModel:
+    """Fits model y(n), choosing the family that best extrapolates.
+
+    Every family is fitted on points with smaller n, and evaluated on the
+    `holdout` fraction of points with largest n. The best family is then
+    refitted on all points.
+    """
+    order = np.argsort(n)
+    n, y = np.asarray(n, dtype=float)[order], np.asarray(y, dtype=float)[order]
+    num_train = max(2, int(len(n) * (1 - holdout)))
+    assert num_train < len(n), "Not enough points to fit a model."
+
+    def candidates(n, y):
+        yield _fit_power(n, y)
+        for family in _LINEAR_FAMILIES:
+            if len(family) + 1 <= len(n):
+                yield _fit_linear(n, y, family)
+
+    best = None
+    train = (n[:num_train], y[:num_train])
+    for index, (_, predict) in enumerate(candidates(*train)):
+        error = np.max(np.abs(predict(n[num_train:]) / y[num_train:] - 1))
+        if best is None or error < best[0]:
+            best = (error, index)
+    formula, predict = list(candidates(n, y))[best[1]]
+    return FittedModel(formula, predict, float(best[0]), int(n[0]), int(n[-1]))
+
+
+def load_results(estimator) -> pd.DataFrame:
+    """Loads results CSV, with metric columns named as in re_utils.METRICS."""
+    df = pd.read_csv(f"results/{estimator}.csv")
+    df.columns = ["op", "n"] + METRICS
+    return df
+
+
+def fit_models(estimator, min_n=16, metrics=METRICS) -> dict:
+    """Fits model for every op and metric in results of the estimator.
+
+    Points with n<min_n are ignored, because they often don't follow the
+    asymptotic behaviour. Returns dict mapping (op, metric) to FittedModel.
+    """
+    df = load_results(estimator)
+    df = df[df["n"] >= min_n]
+    models = {}
+    for op, group in df.groupby("op"):
+        if len(group) < 5:
+            continue
+        for metric in metrics:
+            models[(op, metric)] = fit_metric(group["n"].values,
+                                              group[metric].values)
+    return models
+
+
+def show_models(models) -> pd.DataFrame:
+    table = [[op, metric, m.formula, m.max_rel_error, m.min_n, m.max_n]
+             for (op, metric), m in models.items()]
+    return pd.DataFrame(table, columns=["op", "metric", "formula",
+                                        "max_rel_error", "min_n", "max_n"])
+
+
+def plan_sweep(jobs, models, metrics=METRICS, tolerance=0.01,
+               validate_every=4, max_extrapolation=2.0):
+    """Splits sweep jobs into jobs that must be estimated and predicted ones.
+
+    Job (op, n) is predicted if models of all metrics for op have error bound
+    below `tolerance`, and n is within their range, extended up by factor
+    `max_extrapolation`. Every `validate_every`-th predicted job of each op is
+    still estimated, to validate the model.
+
+    Returns list of jobs to run and dict mapping predicted jobs to metrics.
+    """
+    to_run, predicted = [], {}
+    seen = {}
+    for op, n in sorted(jobs, key=lambda job: (job[0], job[1])):
+        op_models = [models.get((op, metric)) for metric in metrics]
+        trusted = all(m is not None and m.max_rel_error < tolerance and
+                      m.min_n <= n <= m.max_n * max_extrapolation
+                      for m in op_models)
+        if not trusted:
+            to_run.append((op, n))
+            continue
+        seen[op] = seen.get(op, 0) + 1
+        if seen[op] % validate_every == 0:
+            to_run.append((op, n))
+        else:
+            predicted[(op, n)] = [float(m.predict(n)) for m in op_models]
+    return to_run, predicted
@@ -0,0 +1,94 @@
+"""Compares reduction strategies of QuantumArithmetic.ModMulEngine.
+
+Every strategy is measured on one controlled multiplication by a constant
+(as done for every exponent bit), and modular exponentiation with n-bit
+exponent is projected as n such multiplications. The projection is checked
+against full ModExp for small n: it is exact for windowed reductions, whose
+cost doesn't depend on the constant, and approximate for "doubling" and "qft".
+
+Run from the resource_estimate directory:
+    python modmul_engine_comparison.py
+"""
+
+import pandas as pd
+import qsharp
+
+import re_utils
+
+ENGINE = "QuantumArithmetic.ModMulEngine"
+METHODS = [
+    ("doubling", 0),
+    ("qft", 0),
+    ("modadd", 4),
+    ("modadd", 8),
+    ("barrett", 4),
+    ("barrett", 8),
+    ("montgomery", 4),
+    ("montgomery", 8),
+]
+# Tracing QFT-based multiplication takes O(n^3) time.
+QFT_MAX_N = 64
+
+
+def method_expr(reduction, window) -> str:
+    return f'{ENGINE}.MakeModMulMethod("{reduction}",{window})'
+
+
+def mul_op(reduction, window) -> str:
+    return f"{ENGINE}.ModMulByConst(_,_,_,{method_expr(reduction, window)})"
+
+
+def exp_op(reduction, window) -> str:
+    return f"{ENGINE}.ModExp(_,_,_,_,1,{method_expr(reduction, window)})"
+
+
+def _skip(reduction, window, n) -> bool:
+    return window > n or (reduction == "qft" and n > QFT_MAX_N)
+
+
+def _metrics(entry_point, op, n) -> dict:
+    counts = re_utils.logical_counts_with_caching(entry_point, op, n)
+    est = re_utils.estimate_from_logical_counts(entry_point, op, n)
+    return {
+        "qubits": counts["numQubits"],
+        "t_count": (counts["tCount"] + 7 * counts["cczCount"] +
+                    4 * counts["ccixCount"]),
+        "depth": est["physicalCounts"]["breakdown"]["logicalDepth"],
+    }
+
+
+def compare(n_range, methods=METHODS) -> pd.DataFrame:
+    """Per-multiplication costs and projected ModExp costs."""
+    rows = []
+    for n in n_range:
+        for reduction, window in methods:
+            if _skip(reduction, window, n):
+                continue
+            m = _metrics("RunModMulByConst", mul_op(reduction, window), n)
+            rows.append([n, reduction, window, m["qubits"], m["t_count"],
+                         m["depth"], n * m["t_count"], n * m["depth"]])
+    return pd.DataFrame(rows, columns=[
+        "n", "Reduction", "Window", "Qubits", "T count", "Depth",
+        "ModExp T count", "ModExp depth"])
+
+
+def check_projection(n, methods=METHODS) -> pd.DataFrame:
+    """Relative error of projected ModExp T count and depth vs full ModExp."""
+    rows = []
+    for reduction, window in methods:
+        if _skip(reduction, window, n):
+            continue
+        mul = _metrics("RunModMulByConst", mul_op(reduction, window), n)
+        full = _metrics("RunModExp", exp_op(reduction, window), n)
+        rows.append([reduction, window,
+                     n * mul["t_count"] / full["t_count"] - 1,
+                     n * mul["depth"] / full["depth"] - 1])
+    return pd.DataFrame(rows, columns=["Reduction", "Window", "T count error",
+                                       "Depth error"])
+
+
+if __name__ == "__main__":
+    qsharp.init(project_root="../lib/")
+    pd.set_option("display.width", 200)
+    print(check_projection(16).to_string(index=False))
+    print(compare([64, 256, 1024, 2048]).to_string(index=False))
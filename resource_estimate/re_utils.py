@@ -1,52 +1,286 @@
+import hashlib
 import json
 import pandas as pd
 import os
 import time
 import numpy as np
+import qsharp
+from qdk.estimator import LogicalCounts
 from matplotlib import pyplot as plt
 import re
 import math
+import sys
+import multiprocessing as mp
+from multiprocessing import connection as mp_connection
+from result_store import ResultStore
+
+try:
+    import resource
+except ImportError:  # Not available on Windows.
+    resource = None
 
 METRICS = ["Logical qubits", "Physical qubits",
            "Logical depth", "Runtime (seconds)"]
 METRICS_TO_PLOT = [1, 3]
 DEFAULT_N_RANGE = [3] + [int(round(2**(0.25*i))) for i in range(8, 81)]
 DEBUG = False
+_STORE = None
 
 
 def _log2(x):
     return int(round(math.log2(x)))
 
 
+def _results_file(estimate_func) -> str:
+    return f'results/{estimate_func.__name__}.csv'
+
+
+def _get_store() -> ResultStore:
+    global _STORE
+    if _STORE is None:
+        _STORE = ResultStore()
+    return _STORE
+
+
+def _get_result(estimate_func, op, n):
+    store = _get_store()
+    estimator = estimate_func.__name__
+    store.merge_csv(estimator, _results_file(estimate_func))
+    return store.get(estimator, op, n)
+
+
+def _save_result(estimate_func, op, n, metrics):
+    _get_store().put(estimate_func.__name__, op, n, metrics)
+
+
+def export_results(estimate_func):
+    """Writes all results of the estimate function to its CSV file."""
+    _get_store().export_csv(estimate_func.__name__,
+                            _results_file(estimate_func), METRICS)
+
+
+def _run_estimate(estimate_func, op, n) -> list:
+    t0 = time.time()
+    estimates = json.loads(estimate_func(op, n))
+    if DEBUG:
+        dt = time.time()-t0
+        print(f"n={n}, op={op}, t={dt:.3f}s", flush=True)
+    return _extract_metrics(estimates)
+
+
+def _extract_metrics(estimates) -> list:
+    return [
+        estimates['physicalCounts']['breakdown']['algorithmicLogicalQubits'],
+        estimates['physicalCounts']['physicalQubits'],
+        estimates['physicalCounts']['breakdown']['logicalDepth'],
+        estimates['physicalCounts']['runtime']/10**9,
+    ]
+
+
 def run_re_with_caching(estimate_func, op, n) -> list:
-    """Runs resource estimation and stores result in CSV file."""
-    file_name = f'results/{estimate_func.__name__}.csv'
-    if not os.path.exists(file_name):
-        df = pd.DataFrame(columns=['op', 'n'] + METRICS)
-        df.to_csv(file_name, index=False)
-    df = pd.read_csv(file_name)
-    existing = df.loc[(df['op'] == op) & (df['n'] == n)]
-    if len(existing) >= 1:
-        return list(existing.iloc[0, 2:6])
-    else:
+    """Runs resource estimation and stores result in the result store.
+
+    Call `export_results` to update the CSV file.
+    """
+    metrics = _get_result(estimate_func, op, n)
+    if metrics is None:
+        metrics = _run_estimate(estimate_func, op, n)
+        _save_result(estimate_func, op, n, metrics)
+    return metrics
+
+
+def estimate_grid(entry_point, op, n, qubit_params, error_budgets):
+    """Physical estimates for all combinations of qubit params and error budgets.
+
+    `qubit_params` are names of predefined qubit models (e.g.
+    "qubit_gate_ns_e3", "qubit_maj_ns_e6") or dicts of qubit parameters.
+    The circuit is traced once (see `logical_counts_with_caching`), all
+    missing combinations are estimated in one call, and metrics for every
+    combination are cached in the result store.
+
+    Returns DataFrame with columns "Qubit params", "Error budget" and METRICS.
+    """
+    store = _get_store()
+    estimator = f"estimate_grid.{entry_point}"
+    grid = []
+    for qubit in qubit_params:
+        if isinstance(qubit, str):
+            qubit = {"name": qubit}
+        for budget in error_budgets:
+            grid.append({"qubitParams": qubit, "errorBudget": budget})
+    keys = [json.dumps(params, sort_keys=True) for params in grid]
+    metrics = [store.get(estimator, op, n, key) for key in keys]
+
+    missing = [i for i in range(len(grid)) if metrics[i] is None]
+    if len(missing) > 0:
+        counts = logical_counts_with_caching(entry_point, op, n)
+        results = LogicalCounts(counts).estimate([grid[i] for i in missing])
+        for j, i in enumerate(missing):
+            # Result for a single item is not a batch.
+            result = results if len(missing) == 1 else results[j]
+            metrics[i] = _extract_metrics(result)
+            store.put(estimator, op, n, metrics[i], keys[i])
+
+    table = [[params["qubitParams"].get("name", json.dumps(params["qubitParams"])),
+              params["errorBudget"]] + m for params, m in zip(grid, metrics)]
+    return pd.DataFrame(table, columns=["Qubit params", "Error budget"] + METRICS)
+
+
+def _peak_memory_mb():
+    if resource is None:
+        return None
+    peak = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    # Linux reports kilobytes, macOS reports bytes.
+    return peak / 2**20 if sys.platform == "darwin" else peak / 2**10
+
+
+def logical_counts_with_caching(entry_point, op, n) -> dict:
+    """Returns logical counts of `EstimateUtils.{entry_point}(n, op)`.
+
+    Logical counts don't depend on estimator parameters, so they are computed
+    once per (op, n) and stored in the result store.
+    """
+    estimator = f"logical_counts.{entry_point}"
+    counts = _get_store().get(estimator, op, n)
+    if counts is None:
         t0 = time.time()
-        estimates = json.loads(estimate_func(op, n))
+        counts = qsharp.logical_counts(f"EstimateUtils.{entry_point}({n},{op})")
         if DEBUG:
             dt = time.time()-t0
-            print(f"n={n}, op={op}, t={dt:.3f}s", flush=True)
-        metrics = [
-            estimates['physicalCounts']['breakdown']['algorithmicLogicalQubits'],
-            estimates['physicalCounts']['physicalQubits'],
-            estimates['physicalCounts']['breakdown']['logicalDepth'],
-            estimates['physicalCounts']['runtime']/10**9,
-        ]
-        df.loc[len(df)] = [op, n] + metrics
-        df.sort_values(by=["op", "n"], inplace=True)
-        df.to_csv(file_name, index=False)
-        return metrics
-
-
-def run_re_experiments(ops_and_max_n, estimate_func, title=None):
+            print(f"n={n}, op={op}, logical counts t={dt:.3f}s", flush=True)
+        counts = dict(counts)
+        _get_store().put(estimator, op, n, counts)
+    return counts
+
+
+def estimate_from_logical_counts(entry_point, op, n, params=None):
+    """Physical estimates derived from cached logical counts.
+
+    Gives the same result as `qsharp.estimate` with these params, but the
+    circuit is traced only once for all params.
+    """
+    counts = logical_counts_with_caching(entry_point, op, n)
+    return LogicalCounts(counts).estimate(params)
+
+
+def logical_estimate_func(entry_point, params=None, name=None):
+    """Returns estimate function based on cached logical counts.
+
+    It can be used instead of a `qsharp.estimate`-based function in
+    run_re_experiments, show_re_table, trendline_analysis and run_re_sweep.
+    Results are stored under `name`, which defaults to
+    f"estimate_logical_{entry_point}", followed by a hash of `params` if they
+    are given, so different params don't share results.
+    """
+    def estimate_func(op, n):
+        return json.dumps(estimate_from_logical_counts(entry_point, op, n,
+                                                       params))
+    if name is None:
+        name = f"estimate_logical_{entry_point}"
+        if params is not None:
+            key = json.dumps(params, sort_keys=True).encode()
+            name += "_" + hashlib.sha256(key).hexdigest()[:12]
+    estimate_func.__name__ = name
+    return estimate_func
+
+
+def _sweep_worker(estimate_func, op, n, conn):
+    try:
+        metrics = _run_estimate(estimate_func, op, n)
+        conn.send(("done", metrics, _peak_memory_mb()))
+    except Exception as e:
+        conn.send(("failed", repr(e), _peak_memory_mb()))
+    conn.close()
+
+
+def run_re_sweep(jobs, estimate_func, num_workers=None,
+                 max_attempts=1) -> dict:
+    """Runs resource estimation for many (op, n) pairs in parallel.
+
+    Every job runs in its own process, at most `num_workers` at a time
+    (default is number of CPUs). Jobs are started largest n first, so that
+    long jobs don't end up running alone at the end of the sweep. Result of
+    every job is saved to the result store as soon as it finishes. If a job
+    fails (raises, or its process dies, e.g. out of memory), it is reported
+    and the sweep continues.
+
+    State of every job (pending/running/done/failed, number of attempts,
+    duration, peak memory) is kept in the sweep manifest, see `sweep_status`.
+    If a sweep is killed, running it again only runs the jobs that are not
+    done. Jobs that failed `max_attempts` times are skipped; increase it to
+    retry them.
+
+    Returns dict mapping (op, n) to metrics, or to None if the job failed.
+    """
+    num_workers = num_workers or os.cpu_count()
+    store = _get_store()
+    estimator = estimate_func.__name__
+    results = {}
+    pending = []
+    for op, n in jobs:
+        results[(op, n)] = _get_result(estimate_func, op, n)
+        if results[(op, n)] is not None:
+            continue
+        job = store.get_job(estimator, op, n)
+        if job is not None and job["state"] == "failed" and \
+                job["attempts"] >= max_attempts:
+            print(f"Skipping failed job: n={n}, op={op}: {job['error']}")
+            continue
+        store.set_job_state(estimator, op, n, "pending")
+        pending.append((op, n))
+    pending.sort(key=lambda job: job[1])
+
+    # Forking lets workers use functions defined in notebooks.
+    methods = mp.get_all_start_methods()
+    ctx = mp.get_context("fork" if "fork" in methods else None)
+    running = {}
+    while pending or running:
+        while pending and len(running) < num_workers:
+            op, n = pending.pop()
+            recv_conn, send_conn = ctx.Pipe(duplex=False)
+            proc = ctx.Process(target=_sweep_worker,
+                               args=(estimate_func, op, n, send_conn))
+            store.set_job_state(estimator, op, n, "running")
+            proc.start()
+            send_conn.close()
+            running[proc.sentinel] = (proc, recv_conn, op, n, time.time())
+        for sentinel in mp_connection.wait(list(running.keys())):
+            proc, recv_conn, op, n, start_time = running.pop(sentinel)
+            proc.join()
+            try:
+                status, payload, peak_memory = recv_conn.recv()
+            except EOFError:
+                # Process died without sending result.
+                status, payload, peak_memory = \
+                    "failed", f"exit code {proc.exitcode}", None
+            recv_conn.close()
+            duration = time.time() - start_time
+            if status == "done":
+                _save_result(estimate_func, op, n, payload)
+                results[(op, n)] = payload
+                store.set_job_state(estimator, op, n, "done", duration=duration,
+                                    peak_memory_mb=peak_memory)
+            else:
+                print(f"Failed: n={n}, op={op}: {payload}", flush=True)
+                results[(op, n)] = None
+                store.set_job_state(estimator, op, n, "failed", duration=duration,
+                                    peak_memory_mb=peak_memory, error=payload)
+    export_results(estimate_func)
+    return results
+
+
+def sweep_status(estimate_func) -> pd.DataFrame:
+    """Returns sweep manifest: state of every job run by `run_re_sweep`."""
+    return _get_store().jobs(estimate_func.__name__)
+
+
+def run_re_experiments(ops_and_max_n, estimate_func, title=None,
+                       num_workers=1, max_attempts=1):
+    """Runs estimates for all ops and sizes, and plots them.
+
+    If num_workers>1, estimates are run in parallel with `run_re_sweep`, and
+    sizes for which estimation failed are left out of the charts.
+    """
     title = title or estimate_func.__name__
     ops = [op for op, _, _ in ops_and_max_n]
     n_ranges = {}
@@ -58,13 +292,24 @@ def run_re_experiments(ops_and_max_n, estimate_func, title=None):
     plt.rcParams["font.family"] = "serif"
 
     # Run experiments.
+    if num_workers > 1:
+        jobs = [(op, n) for op in ops for n in n_ranges[op]]
+        sweep_results = run_re_sweep(jobs, estimate_func, num_workers,
+                                     max_attempts)
+        for op in ops:
+            n_ranges[op] = [n for n in n_ranges[op]
+                            if sweep_results[(op, n)] is not None]
     for n in DEFAULT_N_RANGE:
         for op in ops:
             if n not in n_ranges[op]:
                 continue
-            estimates = run_re_with_caching(estimate_func, op, n)
+            if num_workers > 1:
+                estimates = sweep_results[(op, n)]
+            else:
+                estimates = run_re_with_caching(estimate_func, op, n)
             for i in range(len(METRICS_TO_PLOT)):
                 charts[i][op].append(estimates[METRICS_TO_PLOT[i]])
+    export_results(estimate_func)
 
     min_n = min(DEFAULT_N_RANGE)
     max_n = max(n for _, _, n in ops_and_max_n)
@@ -115,6 +360,7 @@ def show_re_table(ops_and_max_n, estimate_func, n):
             continue
         estimates = run_re_with_caching(estimate_func, op, n)
         table.append([alias] + estimates)
+    export_results(estimate_func)
     df = pd.DataFrame(table, columns=["Algorithm"] + METRICS)
     return df.style.highlight_min(color='lightgreen', subset=METRICS)
 
@@ -133,5 +379,6 @@ def trendline_analysis(ops_and_max_n, estimate_func, min_n=100):
                 X, np.log(metrics[:, i]), rcond=None)
             trendlines.append("%.04e * n^%.04f" % (np.exp(A), B))
         table.append([alias] + trendlines)
+    export_results(estimate_func)
     df = pd.DataFrame(table, columns=["Algorithm"] + METRICS)
     return df
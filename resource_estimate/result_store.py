@@ -0,0 +1,145 @@
+"""Indexed store for resource estimation results.
+
+Results are kept in an SQLite database, keyed by (estimator, op, n, params),
+where `estimator` is name of the estimate function and `params` is a string
+describing estimator parameters ("" for defaults). Values are JSON-encoded.
+
+SQLite makes lookups indexed and writes atomic, so several processes (sweep
+workers, notebooks) can use the same store at once. The database is a local
+cache; the committed form of results is `results/*.csv`, which is produced by
+`export_csv`. The CSV file is merged into the database when the estimator is
+first used (see `merge_csv`) and again before export, so rows that are only in
+the CSV file are never dropped.
+
+The store also keeps the sweep manifest: state of every estimation job, so
+that interrupted sweeps can be resumed.
+"""
+
+import json
+import os
+import sqlite3
+import time
+
+import pandas as pd
+
+DEFAULT_DB_FILE = "results/results.sqlite"
+
+
+class ResultStore:
+    def __init__(self, db_file=DEFAULT_DB_FILE):
+        self.db_file = db_file
+        self._conn = None
+        self._conn_pid = None
+        self._merged_csv = set()
+
+    def _connect(self) -> sqlite3.Connection:
+        # Connections can't be shared with forked processes.
+        if self._conn is None or self._conn_pid != os.getpid():
+            os.makedirs(os.path.dirname(self.db_file) or ".", exist_ok=True)
+            conn = sqlite3.connect(self.db_file, timeout=60,
+                                   isolation_level=None)
+            conn.execute("PRAGMA journal_mode=WAL")
+            conn.execute("""CREATE TABLE IF NOT EXISTS results (
+                estimator TEXT, op TEXT, n INTEGER, params TEXT, value TEXT,
+                PRIMARY KEY (estimator, op, n, params))""")
+            conn.execute("""CREATE TABLE IF NOT EXISTS jobs (
+                estimator TEXT, op TEXT, n INTEGER, params TEXT, state TEXT,
+                attempts INTEGER, duration REAL, peak_memory_mb REAL,
+                error TEXT, updated REAL,
+                PRIMARY KEY (estimator, op, n, params))""")
+            self._conn, self._conn_pid = conn, os.getpid()
+        return self._conn
+
+    def get(self, estimator, op, n, params=""):
+        """Returns stored value, or None if there is none."""
+        row = self._connect().execute(
+            "SELECT value FROM results "
+            "WHERE estimator=? AND op=? AND n=? AND params=?",
+            (estimator, op, int(n), params)).fetchone()
+        return None if row is None else json.loads(row[0])
+
+    def put(self, estimator, op, n, value, params=""):
+        """Stores value. If value for this key already exists, keeps it."""
+        self._connect().execute(
+            "INSERT OR IGNORE INTO results VALUES (?, ?, ?, ?, ?)",
+            (estimator, op, int(n), params, json.dumps(value)))
+
+    def items(self, estimator, params=""):
+        """Returns list of (op, n, value), sorted by op and n."""
+        rows = self._connect().execute(
+            "SELECT op, n, value FROM results WHERE estimator=? AND params=? "
+            "ORDER BY op, n", (estimator, params)).fetchall()
+        return [(op, n, json.loads(value)) for op, n, value in rows]
+
+    def has_estimator(self, estimator) -> bool:
+        return self._connect().execute(
+            "SELECT 1 FROM results WHERE estimator=? LIMIT 1",
+            (estimator,)).fetchone() is not None
+
+    def get_job(self, estimator, op, n, params=""):
+        """Returns sweep manifest entry of the job as dict, or None."""
+        cursor = self._connect().execute(
+            "SELECT * FROM jobs WHERE estimator=? AND op=? AND n=? AND params=?",
+            (estimator, op, int(n), params))
+        row = cursor.fetchone()
+        if row is None:
+            return None
+        return dict(zip([col[0] for col in cursor.description], row))
+
+    def set_job_state(self, estimator, op, n, state, params="", duration=None,
+                      peak_memory_mb=None, error=None):
+        """Updates state of the job in sweep manifest.
+
+        States are "pending", "running", "done" and "failed". Moving to
+        "running" counts as an attempt.
+        """
+        attempt = 1 if state == "running" else 0
+        self._connect().execute(
+            """INSERT INTO jobs VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
+            ON CONFLICT (estimator, op, n, params) DO UPDATE SET
+            state=excluded.state, attempts=attempts+excluded.attempts,
+            duration=excluded.duration, peak_memory_mb=excluded.peak_memory_mb,
+            error=excluded.error, updated=excluded.updated""",
+            (estimator, op, int(n), params, state, attempt, duration,
+             peak_memory_mb, error, time.time()))
+
+    def jobs(self, estimator) -> pd.DataFrame:
+        """Returns sweep manifest of all jobs of the estimator."""
+        return pd.read_sql_query(
+            "SELECT op, n, params, state, attempts, duration, peak_memory_mb, "
+            "error FROM jobs WHERE estimator=? ORDER BY op, n",
+            self._connect(), params=(estimator,))
+
+    def import_csv(self, estimator, file_name):
+        """Imports rows from CSV file with columns op, n, *metrics."""
+        df = pd.read_csv(file_name)
+        rows = [(estimator, op, int(n), "", json.dumps(metrics))
+                for op, n, *metrics in df.values.tolist()]
+        conn = self._connect()
+        conn.execute("BEGIN")
+        conn.executemany(
+            "INSERT OR IGNORE INTO results VALUES (?, ?, ?, ?, ?)", rows)
+        conn.execute("COMMIT")
+
+    def merge_csv(self, estimator, file_name):
+        """Imports CSV file, once per store. Rows in the database win."""
+        key = (estimator, file_name)
+        if key not in self._merged_csv and os.path.exists(file_name):
+            self.import_csv(estimator, file_name)
+        self._merged_csv.add(key)
+
+    def export_csv(self, estimator, file_name, metric_names):
+        """Writes results with default params to CSV file.
+
+        Rows of the existing file are merged first, so they are kept even if
+        the database doesn't have them. Keeps column names of the existing file.
+        """
+        columns = ["op", "n"] + metric_names
+        if os.path.exists(file_name):
+            self.import_csv(estimator, file_name)
+            header = list(pd.read_csv(file_name, nrows=0).columns)
+            if len(header) == len(columns):
+                columns = header
+        table = [[op, n] + value for op, n, value in self.items(estimator)]
+        df = pd.DataFrame(table, columns=columns)
+        df.to_csv(file_name, index=False)
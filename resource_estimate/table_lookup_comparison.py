@@ -0,0 +1,63 @@
+"""Compares table lookup implementations, alone and inside windowed ModExp.
+
+Run from the resource_estimate directory:
+    python table_lookup_comparison.py
+"""
+
+import pandas as pd
+import qsharp
+
+import re_utils
+
+qsharp.init(project_root="../lib/")
+
+TF = "QuantumArithmetic.TableFunctions"
+LOOKUPS = [
+    (f"{TF}.TableLookup", "Recursive"),
+    (f"{TF}.TableLookupUnary", "Unary"),
+    (f"{TF}.TableLookupSelectSwap(_,_,_,4)", "SELECT-SWAP, 4 copies"),
+    (f"{TF}.TableLookupSelectSwap(_,_,_,16)", "SELECT-SWAP, 16 copies"),
+]
+MOD_EXPS = [
+    ("QuantumArithmetic.LYY2021.ModExpWindowed(_,_,_,_,{w})", "Recursive"),
+    ("QuantumArithmetic.LYY2021.ModExpWindowedUnary(_,_,_,_,{w})", "Unary"),
+    ("QuantumArithmetic.LYY2021.ModExpWindowedSelectSwap(_,_,_,_,{w},4)",
+     "SELECT-SWAP, 4 copies"),
+]
+
+
+def _row(counts):
+    return [counts["numQubits"], counts["cczCount"] + counts["ccixCount"],
+            counts["measurementCount"]]
+
+
+def compare_lookups(n, m_range):
+    """Lookup followed by its adjoint, for n-bit values and 2^m entries."""
+    table = []
+    for m in m_range:
+        for op, alias in LOOKUPS:
+            if "SelectSwap" in op and int(op.split(",")[-1][:-1]) > 2**m:
+                continue
+            counts = qsharp.logical_counts(
+                f"EstimateUtils.RunTableLookup({n},{m},{op})")
+            table.append([m, alias] + _row(counts))
+    return pd.DataFrame(table, columns=["m", "Lookup", "Qubits", "Toffolis",
+                                        "Measurements"])
+
+
+def compare_mod_exp(n_range, window_sizes):
+    table = []
+    for n in n_range:
+        for w in window_sizes:
+            for op, alias in MOD_EXPS:
+                counts = re_utils.logical_counts_with_caching(
+                    "RunModExp", op.format(w=w), n)
+                table.append([n, w, alias] + _row(counts))
+    return pd.DataFrame(table, columns=["n", "Window", "Lookup", "Qubits",
+                                        "Toffolis", "Measurements"])
+
+
+if __name__ == "__main__":
+    pd.set_option("display.width", 200)
+    print(compare_lookups(64, [4, 6, 8, 10, 12]).to_string(index=False))
+    print(compare_mod_exp([32, 64], [4, 8, 11]).to_string(index=False))
@@ -0,0 +1,231 @@
+"""Gate-level traces of operations, for offline analysis.
+
+An operation is traced once by simulating one of the `EstimateUtils.Run*`
+wrappers, and the flat gate sequence is saved as a NumPy structured array
+(.npy file). Analyses (gate counts, T-count, depth, qubit width, Toffoli
+layering) then load the file memory-mapped and don't need the Q# compiler
+or the resource estimator.
+
+Tracing simulates the circuit, and its cost grows superlinearly with the
+number of gates, so it is practical for moderate n (e.g. n<=64 for dividers).
+
+Example:
+    trace = trace_with_caching("RunMultiply", "QuantumArithmetic.CG2019.MultiplyKaratsuba", 32)
+    print(t_count(trace), toffoli_count(trace), depth(trace), qubit_width(trace))
+"""
+
+import hashlib
+import json
+import os
+import re
+
+import numpy as np
+import qsharp
+from qdk.qsharp import CircuitGenerationMethod
+
+# Gate codes. Controlled gates have the same code as uncontrolled ones, e.g.
+# CNOT is X with 1 control, and Toffoli is X with 2 controls.
+GATES = ["X", "Y", "Z", "H", "S", "T", "SX", "Rx", "Ry", "Rz", "R1",
+         "Rxx", "Ryy", "Rzz", "SWAP", "Measure", "Reset"]
+GATE_CODES = {name: code for code, name in enumerate(GATES)}
+MEASURE = GATE_CODES["Measure"]
+RESET = GATE_CODES["Reset"]
+ROTATIONS = [GATE_CODES[g] for g in ["Rx", "Ry", "Rz", "R1", "Rxx", "Ryy", "Rzz"]]
+TRACES_DIR = "traces"
+
+
+def _trace_dtype(max_arity: int) -> np.dtype:
+    # `qubits` holds controls followed by targets, padded with -1.
+    return np.dtype([
+        ("gate", np.uint8),
+        ("adjoint", np.bool_),
+        ("num_controls", np.uint8),
+        ("layer", np.int32),
+        ("arg", np.float64),
+        ("qubits", np.int32, (max_arity,)),
+    ])
+
+
+def _parse_circuit(circuit_json: str) -> np.ndarray:
+    rows = []
+    circuit = json.loads(circuit_json)
+    for layer, column in enumerate(circuit["componentGrid"]):
+        for comp in column["components"]:
+            if comp["kind"] == "measurement":
+                for ref in comp["qubits"]:
+                    rows.append((MEASURE, False, 0, layer, np.nan, [ref["qubit"]]))
+            elif comp["kind"] == "ket":
+                for ref in comp["targets"]:
+                    rows.append((RESET, False, 0, layer, np.nan, [ref["qubit"]]))
+            else:
+                if comp["gate"] not in GATE_CODES:
+                    raise ValueError(f"Unsupported gate: {comp['gate']}.")
+                controls = [ref["qubit"] for ref in comp.get("controls", [])]
+                targets = [ref["qubit"] for ref in comp["targets"]]
+                arg = float(comp["args"][0]) if "args" in comp else np.nan
+                rows.append((GATE_CODES[comp["gate"]], comp.get("isAdjoint", False),
+                             len(controls), layer, arg, controls + targets))
+    max_arity = max((len(row[5]) for row in rows), default=1)
+    trace = np.empty(len(rows), dtype=_trace_dtype(max_arity))
+    for i, row in enumerate(rows):
+        qubits = row[5] + [-1] * (max_arity - len(row[5]))
+        trace[i] = row[:5] + (qubits,)
+    return trace
+
+
+def record_trace(entry_expr: str) -> np.ndarray:
+    """Simulates Q# expression and returns the sequence of applied gates.
+
+    Gates are in program order for every qubit. `layer` is the index of the
+    gate's column in the ASAP-packed circuit.
+    """
+    circuit = qsharp.circuit(
+        entry_expr,
+        generation_method=CircuitGenerationMethod.Simulate,
+        max_operations=2**62,
+        group_by_scope=False,
+    )
+    return _parse_circuit(circuit.json())
+
+
+def save_trace(trace: np.ndarray, file_name: str):
+    os.makedirs(os.path.dirname(file_name) or ".", exist_ok=True)
+    np.save(file_name, trace, allow_pickle=False)
+
+
+def load_trace(file_name: str) -> np.ndarray:
+    """Loads trace, memory-mapped (read-only)."""
+    return np.load(file_name, mmap_mode="r", allow_pickle=False)
+
+
+def trace_with_caching(wrapper: str, op: str, n: int, *args) -> np.ndarray:
+    """Traces `EstimateUtils.{wrapper}(n, *args, op)`, caching it in a file.
+
+    For example, `trace_with_caching("RunRadix", op, 32, 4, adder_op)` traces
+    `EstimateUtils.RunRadix(32, 4, op, adder_op)`.
+    """
+    # Wrappers take sizes first, then the operation, then the rest.
+    sizes, rest = [n], list(args)
+    if wrapper in ("RunRadix", "RunRadixCarry"):
+        sizes, rest = [n, rest[0]], rest[1:]
+    elif wrapper == "Run3WayOp":
+        sizes, rest = [n] + rest[:2], rest[2:]
+    call_args = ",".join(str(a) for a in sizes + [op] + rest)
+    entry_expr = f"EstimateUtils.{wrapper}({call_args})"
+    file_name = trace_file_name(wrapper, entry_expr)
+    if not os.path.exists(file_name):
+        save_trace(record_trace(entry_expr), file_name)
+    return load_trace(file_name)
+
+
+def trace_file_name(wrapper: str, entry_expr: str) -> str:
+    """Cache file for the trace of `entry_expr`.
+
+    The name is the sanitized expression (truncated) followed by a hash of the
+    full expression, so ops with the same name in different namespaces, or
+    expressions that differ only in punctuation, don't share a file.
+    """
+    name = re.sub(r"[\W_]+", "_", entry_expr).strip("_")[:100]
+    digest = hashlib.sha256(entry_expr.encode()).hexdigest()[:16]
+    return os.path.join(TRACES_DIR, wrapper, f"{name}_{digest}.npy")
+
+
+def gate_counts(trace: np.ndarray) -> dict[str, int]:
+    """Number of gates of every type; controlled gates are counted separately,
+    e.g. "CCX" is a Toffoli gate."""
+    keys = trace["gate"].astype(np.int64) * 256 + trace["num_controls"]
+    values, counts = np.unique(keys, return_counts=True)
+    ans = {}
+    for key, count in zip(values, counts):
+        gate, num_controls = GATES[key // 256], key % 256
+        ans["C" * num_controls + gate] = int(count)
+    return ans
+
+
+def _is_toffoli(trace: np.ndarray) -> np.ndarray:
+    return (trace["gate"] == GATE_CODES["X"]) & (trace["num_controls"] == 2)
+
+
+def t_count(trace: np.ndarray) -> int:
+    """Number of uncontrolled T and T† gates."""
+    return int(np.count_nonzero((trace["gate"] == GATE_CODES["T"]) &
+                                (trace["num_controls"] == 0)))
+
+
+def toffoli_count(trace: np.ndarray) -> int:
+    return int(np.count_nonzero(_is_toffoli(trace)))
+
+
+def rotation_count(trace: np.ndarray) -> int:
+    return int(np.count_nonzero(np.isin(trace["gate"], ROTATIONS)))
+
+
+def measurement_count(trace: np.ndarray) -> int:
+    return int(np.count_nonzero(trace["gate"] == MEASURE))
+
+
+def qubit_width(trace: np.ndarray) -> int:
+    """Maximal number of qubits allocated at the same time.
+
+    Simulator reuses ids of released qubits, so this is number of ids.
+    """
+    return int(trace["qubits"].max(initial=-1)) + 1
+
+
+def _asap_layers(trace: np.ndarray, counted: np.ndarray) -> np.ndarray:
+    """ASAP layering, where only `counted` gates take time.
+
+    Returns layer of every gate, or -1 for gates that are not counted. Other
+    gates are free, but still order gates on their qubits.
+    """
+    # Plain Python lists are much faster than NumPy for this sequential loop.
+    level = [0] * qubit_width(trace)
+    layers = [-1] * len(trace)
+    indices = np.flatnonzero(counted | (trace["gate"] != RESET))
+    qubits = [[j for j in q if j >= 0] for q in trace["qubits"][indices].tolist()]
+    for i, q, is_counted in zip(indices.tolist(), qubits, counted[indices].tolist()):
+        start = max(level[j] for j in q)
+        if is_counted:
+            layers[i] = start
+            start += 1
+        for j in q:
+            level[j] = start
+    return np.array(layers, dtype=np.int64)
+
+
+def depth(trace: np.ndarray) -> int:
+    """Circuit depth, where every gate except reset takes one layer."""
+    layers = _asap_layers(trace, trace["gate"] != RESET)
+    return int(layers.max(initial=-1)) + 1
+
+
+def t_depth(trace: np.ndarray) -> int:
+    """Depth counting only T gates (Clifford gates are free)."""
+    counted = (trace["gate"] == GATE_CODES["T"]) & (trace["num_controls"] == 0)
+    return int(_asap_layers(trace, counted).max(initial=-1)) + 1
+
+
+def toffoli_layers(trace: np.ndarray) -> np.ndarray:
+    """Splits Toffoli gates into layers of gates that can be applied in parallel.
+
+    Returns layer number for every Toffoli gate, in trace order. Toffoli depth
+    is `toffoli_layers(trace).max() + 1`, and `np.bincount` of the result gives
+    number of Toffoli gates in every layer.
+    """
+    is_toffoli = _is_toffoli(trace)
+    return _asap_layers(trace, is_toffoli)[is_toffoli]
+
+
+def summarize_trace(trace: np.ndarray) -> dict:
+    toffolis = toffoli_layers(trace)
+    return {
+        "Qubit width": qubit_width(trace),
+        "Gates": len(trace),
+        "Depth": depth(trace),
+        "T count": t_count(trace),
+        "T depth": t_depth(trace),
+        "Toffoli count": len(toffolis),
+        "Toffoli depth": int(toffolis.max(initial=-1)) + 1,
+        "Rotations": rotation_count(trace),
+        "Measurements": measurement_count(trace),
+    }
@@ -0,0 +1,157 @@
+"""Window-size tuner for windowed modular exponentiation.
+
+Cost models and the search over window sizes are implemented in Q#
+(QuantumArithmetic.WindowTuning), so that `ModExpWindowedAuto` entry points
+can use them. This module calibrates the models: it estimates resources for a
+grid of (n, windows), fits model coefficients, and prints them as Q# code to
+be pasted into WindowTuning.qs. It can also tune windows for given n with a
+freshly calibrated model, and check the choice against the estimator.
+
+Models are only fitted on CALIBRATION_N (n=8..32), and predictions for larger
+n are extrapolated. Both `tune` and the Q# optimizers warn when this happens.
+
+Run from the resource_estimate directory:
+    python window_tuner.py
+"""
+
+import json
+import warnings
+
+import numpy as np
+import pandas as pd
+import qsharp
+
+import re_utils
+
+TARGETS = ["qubits", "depth", "t_count", "volume"]
+WT = "QuantumArithmetic.WindowTuning"
+
+# For every family: op with window placeholders, Q# features function, Q#
+# optimizer, default model, and windows used for calibration.
+FAMILIES = {
+    "LYY2021": {
+        "op": "QuantumArithmetic.LYY2021.ModExpWindowed(_,_,_,_,{})",
+        "features": f"{WT}.LYY2021Features",
+        "optimizer": f"{WT}.OptimalLYY2021Window",
+        "model": f"{WT}.LYY2021CostModel()",
+        "windows": [(m,) for m in [1, 2, 3, 4, 6, 8, 10]],
+    },
+    "CG20192": {
+        "op": "QuantumArithmetic.CG20192.ModExpWindow(_,_,_,_,{},{})",
+        "features": f"{WT}.CG20192Features",
+        "optimizer": f"{WT}.OptimalCG20192Windows",
+        "model": f"{WT}.CG20192CostModel()",
+        "windows": [(e, w) for e in [1, 2, 3, 4] for w in [1, 2, 3, 4, 6]],
+    },
+}
+CALIBRATION_N = [8, 12, 16, 24, 32]
+
+
+def measure(family, n, windows) -> dict:
+    """Ancillas, T count and logical depth of ModExp with given windows."""
+    op = FAMILIES[family]["op"].format(*windows)
+    counts = re_utils.logical_counts_with_caching("RunModExp", op, n)
+    est = re_utils.estimate_from_logical_counts("RunModExp", op, n)
+    t_count = (counts["tCount"] + 7 * counts["cczCount"] +
+               4 * counts["ccixCount"])
+    return {
+        "ancillas": counts["numQubits"] - 2 * n,
+        "t_count": t_count,
+        "depth": est["physicalCounts"]["breakdown"]["logicalDepth"],
+    }
+
+
+def features(family, n, windows) -> tuple[list, list]:
+    """Gate features and ancilla features, computed by the Q# model."""
+    args = ",".join(str(a) for a in (n, n) + tuple(windows))
+    return qsharp.eval(f"{FAMILIES[family]['features']}({args})")
+
+
+def _fit(x, y):
+    # Weights make the fit minimize relative error.
+    x, y = np.asarray(x, dtype=float), np.asarray(y, dtype=float)
+    coefs, _, _, _ = np.linalg.lstsq(x / y[:, None], np.ones_like(y),
+                                     rcond=None)
+    return coefs, float(np.max(np.abs(x @ coefs / y - 1)))
+
+
+def calibrate(family, n_range=CALIBRATION_N) -> dict:
+    """Fits cost model of the family.
+
+    Returns dict with coefficients for "TCount", "Depth" and "Ancillas",
+    range of n it was fitted on in "MinN" and "MaxN", and maximal relative
+    error of every fit (on the calibration points) in "errors".
+    """
+    gate_x, ancilla_x, data = [], [], []
+    for n in n_range:
+        for windows in FAMILIES[family]["windows"]:
+            if max(windows) > n:
+                continue
+            gate_features, ancilla_features = features(family, n, windows)
+            gate_x.append(gate_features)
+            ancilla_x.append(ancilla_features)
+            data.append(measure(family, n, windows))
+    model, errors = {}, {}
+    for name, x, metric in [("TCount", gate_x, "t_count"),
+                            ("Depth", gate_x, "depth"),
+                            ("Ancillas", ancilla_x, "ancillas")]:
+        coefs, errors[name] = _fit(x, [d[metric] for d in data])
+        model[name] = coefs.tolist()
+    model["MinN"], model["MaxN"] = min(n_range), max(n_range)
+    model["errors"] = errors
+    return model
+
+
+def model_to_qsharp(model) -> str:
+    """Q# expression constructing WindowCostModel."""
+    fields = ", ".join(
+        f"{name} = [{', '.join('%.6e' % c for c in model[name])}]"
+        for name in ["TCount", "Depth", "Ancillas"])
+    fields += f", MinN = {model['MinN']}, MaxN = {model['MaxN']}"
+    return f"new {WT}.WindowCostModel {{ {fields} }}"
+
+
+def tune(family, n, target, max_ancillas=-1, model=None) -> tuple:
+    """Returns optimal windows for n-bit ModExp.
+
+    Uses the default model from WindowTuning.qs unless `model` (result of
+    `calibrate`) is given. Negative `max_ancillas` means no limit.
+    """
+    assert target in TARGETS, f"Unknown target: {target}."
+    if model is None:
+        model_expr = FAMILIES[family]["model"]
+        min_n, max_n = min(CALIBRATION_N), max(CALIBRATION_N)
+    else:
+        model_expr = model_to_qsharp(model)
+        min_n, max_n = model["MinN"], model["MaxN"]
+    if not min_n <= n <= max_n:
+        warnings.warn(f"{family} model was fitted for n={min_n}..{max_n}, "
+                      f"windows for n={n} are extrapolated.")
+    ans = qsharp.eval(f"{FAMILIES[family]['optimizer']}"
+                      f"({n},{n},\"{target}\",{max_ancillas},{model_expr})")
+    return ans if isinstance(ans, tuple) else (ans,)
+
+
+def compare_with_estimator(family, n, target, max_ancillas=-1) -> pd.DataFrame:
+    """Measures every calibration window for n, and marks the tuned one."""
+    tuned = tune(family, n, target, max_ancillas)
+    rows = []
+    for windows in dict.fromkeys(FAMILIES[family]["windows"] + [tuned]):
+        if max(windows) > n:
+            continue
+        m = measure(family, n, windows)
+        m["qubits"] = m["ancillas"] + 2 * n
+        m["volume"] = m["qubits"] * m["depth"]
+        rows.append([windows, m["ancillas"], m[target], windows == tuned])
+    return pd.DataFrame(rows, columns=["windows", "ancillas", target, "tuned"])
+
+
+if __name__ == "__main__":
+    qsharp.init(project_root="../lib/")
+    for family in FAMILIES:
+        model = calibrate(family)
+        print(f"{family}: max relative errors {json.dumps(model['errors'])}")
+        print(model_to_qsharp(model))
+        for target in TARGETS:
+            print(target, [tune(family, n, target, model=model)
+                           for n in [32, 256, 2048]])
@@ -3,6 +3,13 @@ import random
 import pytest
 from test_utils import ArithmeticOpTester
 
+ADDERS = [
+    "Std.Arithmetic.RippleCarryTTKIncByLE",
+    "Std.Arithmetic.RippleCarryCGIncByLE",
+    "QuantumArithmetic.CDKM2004.Add",
+    'QuantumArithmetic.PrefixAdder.AddInPlace(_,_,"kogge_stone")',
+]
+
 
 @pytest.mark.parametrize("n", [2, 4, 8, 16, 24, 32, 63])
 def test_division(n: int):
@@ -12,3 +19,14 @@ def test_division(n: int):
         a, b = random.randint(0, 2**n - 1), random.randint(1, 2 ** (n - 1) - 1)
         result = tester.run([a, b, 0])
         assert result == [a % b, b, a // b]
+
+
+@pytest.mark.parametrize("adder", ADDERS)
+@pytest.mark.parametrize("n", [2, 8, 16])
+def test_division_with_config(n: int, adder: str):
+    cfg = f"QuantumArithmetic.ArithmeticConfig.ConfigWithAdder({adder})"
+    op = f"QuantumArithmetic.AKBF2011.Divide_RestoringWithConfig(_,_,_,{cfg})"
+    tester = ArithmeticOpTester(op, [n, n, n])
+    for _ in range(5):
+        a, b = random.randint(0, 2**n - 1), random.randint(1, 2 ** (n - 1) - 1)
+        assert tester.run([a, b, 0]) == [a % b, b, a // b]
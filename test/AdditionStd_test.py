@@ -36,6 +36,21 @@ def test_Add_TTK(n: int):
         assert tester.run([x, y, 0]) == [x, y, (x + y) % (2**n)]
 
 
+@pytest.mark.parametrize(
+    "op",
+    [
+        "QuantumArithmetic.AdditionStd.Add_TTK",
+        "QuantumArithmetic.AdditionStd.Add_CG",
+    ],
+)
+@pytest.mark.parametrize("n", [1, 4, 8])
+def test_Add_exhaustive(op: str, n: int):
+    tester = ArithmeticOpTester(op, [n, n])
+    (xs, ys), (new_xs, ans) = tester.run_exhaustive([None, None])
+    assert new_xs == xs
+    assert ans == [(x + y) % (2**n) for x, y in zip(xs, ys)]
+
+
 @pytest.mark.parametrize("n", [2, 8])
 def test_Add_QFT(n: int):
     tester = ArithmeticOpTester("QuantumArithmetic.AdditionStd.Add_QFT", [n, n])
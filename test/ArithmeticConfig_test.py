@@ -0,0 +1,77 @@
+import random
+
+import pytest
+
+from test_utils import ArithmeticOpTester
+
+AC = "QuantumArithmetic.ArithmeticConfig"
+
+
+@pytest.mark.parametrize("n", [1, 8, 63, 64, 100])
+def test_Increment(n: int):
+    tester = ArithmeticOpTester(f"{AC}.Increment(_,{AC}.DefaultConfig())", [n])
+    for x in [0, 2**n - 1, random.randint(0, 2**n - 1)]:
+        assert tester.run([x]) == [(x + 1) % 2**n]
+
+
+@pytest.mark.parametrize("num_controls", [0, 1, 3])
+def test_ApplySingleControlled(num_controls: int):
+    n = 8
+    adder = "Std.Arithmetic.RippleCarryCGIncByLE"
+    op = f"((c,x,y)=>{AC}.ApplySingleControlled({adder},c,(x,y)))"
+    tester = ArithmeticOpTester(op, [num_controls, n, n])
+    for ctrl in range(2**num_controls):
+        x, y = random.randint(0, 2**n - 1), random.randint(0, 2**n - 1)
+        expected = (x + y) % 2**n if ctrl == 2**num_controls - 1 else y
+        assert tester.run([ctrl, x, y]) == [ctrl, x, expected]
+
+
+# Configs with adders that support only Adjoint.
+T_OPTIMIZED_CONFIGS = [
+    f"{AC}.ConfigWithUncontrolledAdder(QuantumArithmetic.CDKM2004.AddTOptimized)",
+    f"{AC}.ConfigWithUncontrolledAdder(QuantumArithmetic.TR2013.AddTOptimized)",
+    f"{AC}.ConfigWithUncontrolledAdder(QuantumArithmetic.DM2004.Add_Mod2NTOptimized)",
+    f"{AC}.ConfigWithUncontrolledAdder({AC}.OutOfPlaceAsInPlaceAdder(QuantumArithmetic.CT2002.AddTOptimized,_,_))",
+    f"{AC}.ConfigWithAdders(QuantumArithmetic.CDKM2004.AddTOptimized,QuantumArithmetic.MCT2017.CtrlAddMod2NTOptimized)",
+]
+
+
+@pytest.mark.parametrize("cfg", T_OPTIMIZED_CONFIGS)
+@pytest.mark.parametrize("num_controls", [0, 1, 2])
+def test_TOptimizedConfig(cfg: str, num_controls: int):
+    n = 8
+    ops = {
+        "Add": lambda x, y: (x + y) % 2**n,
+        "Subtract": lambda x, y: (y - x) % 2**n,
+    }
+    for name, f in ops.items():
+        op = f"((c,x,y)=>Controlled {AC}.{name}(c,(x,y,{cfg})))"
+        tester = ArithmeticOpTester(op, [num_controls, n, n])
+        for ctrl in range(2**num_controls):
+            x, y = random.randint(0, 2**n - 1), random.randint(0, 2**n - 1)
+            expected = f(x, y) if ctrl == 2**num_controls - 1 else y
+            assert tester.run([ctrl, x, y]) == [ctrl, x, expected]
+
+    op = f"((c,z,x,y)=>Controlled {AC}.CtrlAdd(c,(z[0],x,y,{cfg})))"
+    tester = ArithmeticOpTester(op, [num_controls, 1, n, n])
+    for ctrl in range(2**num_controls):
+        x, y = random.randint(0, 2**n - 1), random.randint(0, 2**n - 1)
+        expected = (x + y) % 2**n if ctrl == 2**num_controls - 1 else y
+        assert tester.run([ctrl, 1, x, y]) == [ctrl, 1, x, expected]
+        assert tester.run([ctrl, 0, x, y]) == [ctrl, 0, x, y]
+
+    op = f"((c,x)=>Controlled {AC}.Increment(c,(x,{cfg})))"
+    tester = ArithmeticOpTester(op, [num_controls, n])
+    for ctrl in range(2**num_controls):
+        x = random.randint(0, 2**n - 1)
+        expected = (x + 1) % 2**n if ctrl == 2**num_controls - 1 else x
+        assert tester.run([ctrl, x]) == [ctrl, expected]
+
+
+@pytest.mark.parametrize("n1,n2", [(0, 4), (3, 8), (8, 8)])
+def test_AddPadded(n1: int, n2: int):
+    cfg = f"{AC}.ConfigWithUncontrolledAdder(QuantumArithmetic.CDKM2004.AddTOptimized)"
+    tester = ArithmeticOpTester(f"{AC}.AddPadded(_,_,{cfg})", [n1, n2])
+    for _ in range(3):
+        x, y = random.randint(0, 2**n1 - 1), random.randint(0, 2**n2 - 1)
+        assert tester.run([x, y]) == [x, (x + y) % 2**n2]
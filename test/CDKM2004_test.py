@@ -11,6 +11,7 @@ from superposition_test_utils import check_superposition_binary_inplace
     [
         "QuantumArithmetic.CDKM2004.Add",
         "QuantumArithmetic.CDKM2004.AddUnoptimized",
+        "QuantumArithmetic.CDKM2004.AddTOptimized",
     ],
 )
 def test_Add(n: int, op: str):
@@ -20,14 +21,32 @@ def test_Add(n: int, op: str):
         assert tester.run([x, y]) == [x, (x + y) % (2**n)]
 
 
+@pytest.mark.parametrize("n", [1, 2, 3, 4, 8])
+def test_Add_exhaustive(n: int):
+    tester = ArithmeticOpTester("QuantumArithmetic.CDKM2004.Add", [n, n])
+    (xs, ys), (new_xs, ans) = tester.run_exhaustive([None, None])
+    assert new_xs == xs
+    assert ans == [(x + y) % (2**n) for x, y in zip(xs, ys)]
+
+
 @pytest.mark.parametrize(
     "op",
     [
         "QuantumArithmetic.CDKM2004.Add",
         "QuantumArithmetic.CDKM2004.AddUnoptimized",
+        "QuantumArithmetic.CDKM2004.AddTOptimized",
     ],
 )
 def test_superposition(op: str):
     n = 8
     classical_op = lambda x, y: (x + y) % (2**n)
     check_superposition_binary_inplace(n, op, classical_op)
+
+
+@pytest.mark.parametrize("n", [1, 2, 4, 8, 32])
+def test_AddWithCarryTOptimized(n: int):
+    op = "((a,b,c)=>QuantumArithmetic.CDKM2004.AddWithCarryTOptimized(a,b,c[0]))"
+    tester = ArithmeticOpTester(op, [n, n, 1])
+    for _ in range(10):
+        x, y = random.randint(0, 2**n - 1), random.randint(0, 2**n - 1)
+        assert tester.run([x, y, 0]) == [x, (x + y) % (2**n), (x + y) // (2**n)]
@@ -16,11 +16,21 @@ def test_Multiply(n: int):
     assert ans == x * y + t
 
 
+@pytest.mark.parametrize(
+    "op",
+    [
+        "QuantumArithmetic.CG20192.ModExpWindow(_,_,{a}L,{N}L,2,2)",
+        'QuantumArithmetic.CG20192.ModExpWindowedAuto(_,_,{a}L,{N}L,"t_count",-1)',
+        "QuantumArithmetic.CG20192.ModExpWindowWithConfig(_,_,{a}L,{N}L,2,2,"
+        + "QuantumArithmetic.ArithmeticConfig.ConfigWithUncontrolledAdder("
+        + "QuantumArithmetic.CDKM2004.AddTOptimized))",
+    ],
+)
 @pytest.mark.parametrize("n", [3, 4, 8, 16, 32])
-def test_ModExp(n: int):
+def test_ModExp(op: str, n: int):
     N = 1 + 2 * random.randint(1, 2 ** (n - 1) - 1)
     a = random_coprime(N)
-    op = f"QuantumArithmetic.CG20192.ModExpWindow(_,_,{a}L,{N}L,2,2)"
+    op = op.format(a=a, N=N)
     tester = ArithmeticOpTester(op, [n, n])
     x = random.randint(0, 2**n - 1)
     assert tester.run([x, 0]) == [x, pow(a, x, mod=N)]
@@ -27,3 +27,20 @@ def test_superposition():
     op = "QuantumArithmetic.CG2019.MultiplyKaratsuba"
     classical_op = lambda x, y: x * y
     check_superposition_binary([n, n, 2 * n], op, classical_op)
+
+
+@pytest.mark.parametrize(
+    "adder",
+    [
+        "ConfigWithAdder(Std.Arithmetic.RippleCarryCGIncByLE)",
+        "ConfigWithUncontrolledAdder(QuantumArithmetic.CDKM2004.AddTOptimized)",
+    ],
+)
+@pytest.mark.parametrize("name", ["MultiplySchoolbookWithConfig", "MultiplyKaratsubaWithConfig"])
+@pytest.mark.parametrize("n", [1, 8, 40])
+def test_MultiplyWithConfig(n: int, name: str, adder: str):
+    cfg = f"QuantumArithmetic.ArithmeticConfig.{adder}"
+    op = f"QuantumArithmetic.CG2019.{name}(_,_,_,{cfg})"
+    tester = ArithmeticOpTester(op, [n, n, 2 * n])
+    x, y = random.randint(0, 2**n - 1), random.randint(0, 2**n - 1)
+    assert tester.run([x, y, 0]) == [x, y, x * y]
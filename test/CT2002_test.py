@@ -5,8 +5,9 @@ from test_utils import ArithmeticOpTester
 
 
 @pytest.mark.parametrize("n", [2, 8, 16, 32, 63])
-def test_Add(n: int):
-    tester = ArithmeticOpTester("QuantumArithmetic.CT2002.Add", [n, n, n])
+@pytest.mark.parametrize("name", ["Add", "AddTOptimized"])
+def test_Add(n: int, name: str):
+    tester = ArithmeticOpTester(f"QuantumArithmetic.CT2002.{name}", [n, n, n])
     for _ in range(10):
         x, y = random.randint(0, 2**n - 1), random.randint(0, 2**n - 1)
         assert tester.run([x, y, 0]) == [x, y, (x + y) % (2**n)]
@@ -0,0 +1,61 @@
+import random
+
+import pytest
+
+from test_utils import ArithmeticOpTester
+
+CD = "QuantumArithmetic.ConstDivider"
+
+
+@pytest.mark.parametrize("n", [1, 2, 3, 4])
+def test_DivideByConstant_exhaustive(n: int):
+    for d in range(1, 2**n):
+        tester = ArithmeticOpTester(f"{CD}.DivideByConstant(_,{d}L,_,_)", [n, n, n])
+        for x in range(2**n):
+            assert tester.run([x, 0, 0]) == [x, x // d, x % d]
+
+
+@pytest.mark.parametrize("n", [5, 8, 16, 32, 64, 100])
+def test_DivideByConstant(n: int):
+    divisors = [1, 3, 7, 2 ** (n // 2) + 1, 2 ** (n - 1), 2**n - 1]
+    divisors += [random.randint(1, 2**n - 1) for _ in range(3)]
+    for d in divisors:
+        tester = ArithmeticOpTester(f"{CD}.DivideByConstant(_,{d}L,_,_)", [n, n, n])
+        values = [0, 2**n - 1, (2**n - 1) // d * d, d - 1]
+        values += [random.randint(0, 2**n - 1) for _ in range(3)]
+        for x in values:
+            assert tester.run([x, 0, 0]) == [x, x // d, x % d]
+
+
+def test_DivideByConstant_Controlled():
+    n, d = 12, 29
+    op = f"((c,z,q,r)=>Controlled {CD}.DivideByConstant(c,(z,{d}L,q,r)))"
+    tester = ArithmeticOpTester(op, [1, n, n, n])
+    for ctrl in [0, 1]:
+        for _ in range(3):
+            x = random.randint(0, 2**n - 1)
+            expected = [1, x, x // d, x % d] if ctrl else [0, x, 0, 0]
+            assert tester.run([ctrl, x, 0, 0]) == expected
+
+
+@pytest.mark.parametrize(
+    "cfg",
+    [
+        "ConfigWithAdder(QuantumArithmetic.CDKM2004.Add)",
+        "ConfigWithUncontrolledAdder(QuantumArithmetic.CDKM2004.AddTOptimized)",
+    ],
+)
+@pytest.mark.parametrize("n", [4, 16])
+def test_DivideByConstantWithConfig(n: int, cfg: str):
+    cfg = f"QuantumArithmetic.ArithmeticConfig.{cfg}"
+    for d in [1, 3, 2 ** (n - 1) + 1, random.randint(1, 2**n - 1)]:
+        tester = ArithmeticOpTester(f"{CD}.DivideByConstantWithConfig(_,{d}L,_,_,{cfg})", [n, n, n])
+        for x in [0, 2**n - 1, random.randint(0, 2**n - 1)]:
+            assert tester.run([x, 0, 0]) == [x, x // d, x % d]
+
+    op = f"((c,z,q,r)=>Controlled {CD}.DivideByConstantWithConfig(c,(z,5L,q,r,{cfg})))"
+    tester = ArithmeticOpTester(op, [1, n, n, n])
+    for ctrl in [0, 1]:
+        x = random.randint(0, 2**n - 1)
+        expected = [1, x, x // 5, x % 5] if ctrl else [0, x, 0, 0]
+        assert tester.run([ctrl, x, 0, 0]) == expected
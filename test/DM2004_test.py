@@ -5,8 +5,9 @@ import pytest
 from test_utils import ArithmeticOpTester
 
 @pytest.mark.parametrize("n", [2, 8, 16, 32])
-def test_Add(n: int):
-    op = "((a,b,c)=>QuantumArithmetic.DM2004.Add(a,b,c[0]))"
+@pytest.mark.parametrize("name", ["Add", "AddTOptimized"])
+def test_Add(n: int, name: str):
+    op = f"((a,b,c)=>QuantumArithmetic.DM2004.{name}(a,b,c[0]))"
     tester = ArithmeticOpTester(op, [n, n, 1])
     for _ in range(10):
         x, y = random.randint(0, 2**n - 1), random.randint(0, 2**n - 1)
@@ -15,8 +16,9 @@ def test_Add(n: int):
 
 
 @pytest.mark.parametrize("n", [2, 8, 16, 32])
-def test_Add_Mod2N(n: int):
-    tester = ArithmeticOpTester("QuantumArithmetic.DM2004.Add_Mod2N", [n, n])
+@pytest.mark.parametrize("name", ["Add_Mod2N", "Add_Mod2NTOptimized"])
+def test_Add_Mod2N(n: int, name: str):
+    tester = ArithmeticOpTester(f"QuantumArithmetic.DM2004.{name}", [n, n])
     for _ in range(10):
         x, y = random.randint(0, 2**n - 1), random.randint(0, 2**n - 1)
-        assert tester.run([x, y]) == [x, (x + y) % (2**n)]
\ No newline at end of file
+        assert tester.run([x, y]) == [x, (x + y) % (2**n)]
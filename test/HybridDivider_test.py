@@ -0,0 +1,70 @@
+import random
+
+import pytest
+
+from test_utils import ArithmeticOpTester
+
+HD = "QuantumArithmetic.HybridDivider"
+
+
+@pytest.mark.parametrize("n", [2, 3, 4, 5, 8, 16, 31, 64, 100])
+def test_Divide(n: int):
+    tester = ArithmeticOpTester(f"{HD}.Divide", [n, n - 1, n])
+    for _ in range(5):
+        x, y = random.randint(0, 2**n - 1), random.randint(1, 2 ** (n - 1) - 1)
+        assert tester.run([x, y, 0]) == [x % y, y, x // y]
+
+
+@pytest.mark.parametrize("n", [2, 3, 4])
+def test_Divide_exhaustive(n: int):
+    tester = ArithmeticOpTester(f"{HD}.Divide", [n, n - 1, n])
+    for x in range(2**n):
+        for y in range(1, 2 ** (n - 1)):
+            assert tester.run([x, y, 0]) == [x % y, y, x // y]
+
+
+@pytest.mark.parametrize(
+    "adder",
+    [
+        "Std.Arithmetic.RippleCarryTTKIncByLE",
+        "QuantumArithmetic.CDKM2004.Add",
+        'QuantumArithmetic.PrefixAdder.AddInPlace(_,_,"brent_kung")',
+    ],
+)
+@pytest.mark.parametrize("n", [3, 8, 17])
+def test_DivideWithConfig(n: int, adder: str):
+    cfg = f"QuantumArithmetic.ArithmeticConfig.ConfigWithAdder({adder})"
+    tester = ArithmeticOpTester(f"{HD}.DivideWithConfig(_,_,_,{cfg})", [n, n - 1, n])
+    for _ in range(5):
+        x, y = random.randint(0, 2**n - 1), random.randint(1, 2 ** (n - 1) - 1)
+        assert tester.run([x, y, 0]) == [x % y, y, x // y]
+
+
+def test_Divide_Controlled():
+    n = 10
+    op = f"((c,a,b,q)=>Controlled {HD}.Divide(c,(a,b,q)))"
+    tester = ArithmeticOpTester(op, [1, n, n - 1, n])
+    for ctrl in [0, 1]:
+        for _ in range(3):
+            x, y = random.randint(0, 2**n - 1), random.randint(1, 2 ** (n - 1) - 1)
+            expected = [1, x % y, y, x // y] if ctrl else [0, x, y, 0]
+            assert tester.run([ctrl, x, y, 0]) == expected
+
+
+@pytest.mark.parametrize(
+    "cfg",
+    [
+        "ConfigWithUncontrolledAdder(QuantumArithmetic.CDKM2004.AddTOptimized)",
+        "ConfigWithAdders(QuantumArithmetic.CDKM2004.AddTOptimized,QuantumArithmetic.MCT2017.CtrlAddMod2NTOptimized)",
+    ],
+)
+def test_DivideWithConfig_TOptimized(cfg: str):
+    n = 12
+    cfg = f"QuantumArithmetic.ArithmeticConfig.{cfg}"
+    op = f"((c,a,b,q)=>Controlled {HD}.DivideWithConfig(c,(a,b,q,{cfg})))"
+    tester = ArithmeticOpTester(op, [1, n, n - 1, n])
+    for ctrl in [0, 1]:
+        for _ in range(3):
+            x, y = random.randint(0, 2**n - 1), random.randint(1, 2 ** (n - 1) - 1)
+            expected = [1, x % y, y, x // y] if ctrl else [0, x, y, 0]
+            assert tester.run([ctrl, x, y, 0]) == expected
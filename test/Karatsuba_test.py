@@ -0,0 +1,93 @@
+import random
+
+import pytest
+
+from superposition_test_utils import check_superposition_binary
+from test_utils import ArithmeticOpTester, eval_qsharp
+
+K = "QuantumArithmetic.Karatsuba"
+
+
+def _config(base: str, cutoff: int, budget: int) -> str:
+    return f'new {K}.KaratsubaConfig {{ Base = "{base}", Cutoff = {cutoff}, QubitBudget = {budget} }}'
+
+
+@pytest.mark.parametrize("base", ["mct", "mct_t", "schoolbook", "tree"])
+@pytest.mark.parametrize(
+    "n1,n2", [(1, 1), (3, 7), (8, 8), (13, 5), (16, 3), (20, 20), (17, 9), (40, 33)]
+)
+def test_Multiply(n1: int, n2: int, base: str):
+    op = f"((a,b,c)=>{K}.Multiply(a,b,c,{_config(base, 3, 0)}))"
+    tester = ArithmeticOpTester(op, [n1, n2, n1 + n2])
+    for _ in range(3):
+        a = random.randint(0, 2**n1 - 1)
+        b = random.randint(0, 2**n2 - 1)
+        c = random.randint(0, 2 ** (n1 + n2) - 1)
+        assert tester.run([a, b, c]) == [a, b, (c + a * b) % 2 ** (n1 + n2)]
+
+
+@pytest.mark.parametrize("budget", [1, 100, 200, 400])
+def test_Multiply_QubitBudget(budget: int):
+    n1, n2 = 32, 24
+    op = f'((a,b,c)=>{K}.Multiply(a,b,c,{_config("mct", 4, budget)}))'
+    tester = ArithmeticOpTester(op, [n1, n2, n1 + n2])
+    for _ in range(3):
+        a = random.randint(0, 2**n1 - 1)
+        b = random.randint(0, 2**n2 - 1)
+        assert tester.run([a, b, 0]) == [a, b, a * b]
+
+
+def test_MultiplyAncillas():
+    n = 256
+    unlimited = eval_qsharp(f'{K}.MultiplyAncillas({n},{n},{_config("mct", 16, 0)})')
+    for budget in [6000, 4000, 2500]:
+        ancillas = eval_qsharp(f'{K}.MultiplyAncillas({n},{n},{_config("mct", 16, budget)})')
+        assert ancillas <= budget < unlimited
+    # Too small budget gives the fewest ancillas.
+    fewest = eval_qsharp(f'{K}.MultiplyAncillas({n},{n},{_config("mct", 16, 1)})')
+    assert fewest < 2500
+
+
+def test_Multiply_Controlled():
+    n1, n2 = 10, 7
+    op = f'((c,a,b,d)=>Controlled {K}.Multiply(c,(a,b,d,{_config("mct", 3, 0)})))'
+    tester = ArithmeticOpTester(op, [1, n1, n2, n1 + n2])
+    for ctrl in [0, 1]:
+        a = random.randint(0, 2**n1 - 1)
+        b = random.randint(0, 2**n2 - 1)
+        assert tester.run([ctrl, a, b, 0]) == [ctrl, a, b, ctrl * a * b]
+
+
+def test_superposition():
+    n = 8
+    op = f'((a,b,c)=>{K}.Multiply(a,b,c,{_config("mct", 3, 0)}))'
+    check_superposition_binary([n, n, 2 * n], op, lambda x, y: x * y)
+
+
+CONFIGS = [
+    "QuantumArithmetic.ArithmeticConfig.ConfigWithAdder(QuantumArithmetic.CDKM2004.Add)",
+    "QuantumArithmetic.ArithmeticConfig.ConfigWithUncontrolledAdder(QuantumArithmetic.CDKM2004.AddTOptimized)",
+]
+
+
+@pytest.mark.parametrize("cfg", CONFIGS)
+@pytest.mark.parametrize("base", ["mct", "mct_t", "schoolbook", "tree"])
+@pytest.mark.parametrize("n1,n2", [(8, 8), (13, 5), (17, 9)])
+def test_MultiplyWithConfig(n1: int, n2: int, base: str, cfg: str):
+    op = f"((a,b,c)=>{K}.MultiplyWithConfig(a,b,c,{_config(base, 3, 0)},{cfg}))"
+    tester = ArithmeticOpTester(op, [n1, n2, n1 + n2])
+    a = random.randint(0, 2**n1 - 1)
+    b = random.randint(0, 2**n2 - 1)
+    c = random.randint(0, 2 ** (n1 + n2) - 1)
+    assert tester.run([a, b, c]) == [a, b, (c + a * b) % 2 ** (n1 + n2)]
+
+
+@pytest.mark.parametrize("cfg", CONFIGS)
+def test_MultiplyWithConfig_Controlled(cfg: str):
+    n1, n2 = 10, 7
+    op = f'((c,a,b,d)=>Controlled {K}.MultiplyWithConfig(c,(a,b,d,{_config("mct", 3, 0)},{cfg})))'
+    tester = ArithmeticOpTester(op, [1, n1, n2, n1 + n2])
+    for ctrl in [0, 1]:
+        a = random.randint(0, 2**n1 - 1)
+        b = random.randint(0, 2**n2 - 1)
+        assert tester.run([ctrl, a, b, 0]) == [ctrl, a, b, ctrl * a * b]
@@ -16,14 +16,14 @@ def _cto(x: int) -> int:
     return _ctz(x + 1)
 
 
-@pytest.mark.parametrize("x_size", [1, 2, 3, 4, 5, 6])
+@pytest.mark.parametrize("x_size", [1, 2, 3, 4, 5, 6, 10, 16])
 def test_CountTrailingOnes_exhaustive(x_size: int):
     op = "QuantumArithmetic.LAInc.CountTrailingOnes"
     ans_size = math.floor(math.log2(x_size)) + 1
     tester = ArithmeticOpTester(op, [x_size, ans_size])
-    for x in range(2**x_size):
-        result = tester.run([x, 0])
-        assert result == [x, _cto(x)]
+    (xs, _), (new_xs, ans) = tester.run_exhaustive([None, 0])
+    assert new_xs == xs
+    assert ans == [_cto(x) for x in xs]
 
 
 @pytest.mark.parametrize("x_size", [10, 20, 30])
@@ -52,12 +52,21 @@ def test_FlipFirst(target_size: int):
         assert result == [target_init ^ ((1 << flip_count) - 1), flip_count]
 
 
-@pytest.mark.parametrize("n", [1, 2, 3, 4, 5, 6])
+@pytest.mark.parametrize("n", [1, 2, 3, 4, 5, 6, 10, 16])
 def test_IncrementByFlip_exhaustive(n: int):
     op = "QuantumArithmetic.LAInc.IncrementByFlip"
     tester = ArithmeticOpTester(op, [n])
-    for x in range(2**n):
-        assert tester.run([x]) == [(x + 1) % (2**n)]
+    ((xs,), (ans,)) = tester.run_exhaustive([None])
+    assert ans == [(x + 1) % (2**n) for x in xs]
+
+
+def test_IncrementByFlip_batch():
+    op = "QuantumArithmetic.LAInc.IncrementByFlip"
+    n = 8
+    tester = ArithmeticOpTester(op, [n])
+    xs = [random.randint(0, 2**n - 1) for _ in range(50)]
+    results = tester.run_batch([[x] for x in xs])
+    assert results == [[(x + 1) % (2**n)] for x in xs]
 
 
 @pytest.mark.parametrize("n", [10, 15, 16, 20, 100])
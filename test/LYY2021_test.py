@@ -3,7 +3,9 @@ import random
 import pytest
 
 import test_utils
-from test_utils import ArithmeticOpTester, run_unary_op
+from test_utils import CONTEXT, ArithmeticOpTester, run_unary_op
+
+LYY = "QuantumArithmetic.LYY2021"
 
 
 def test_AddConstant():
@@ -65,7 +67,10 @@ def test_ModMulByConstFast(n: int):
         "QuantumArithmetic.LYY2021.ModExpWindowed(_,_,{a}L,{N}L,1)",
         "QuantumArithmetic.LYY2021.ModExpWindowed(_,_,{a}L,{N}L,3)",
         "QuantumArithmetic.LYY2021.ModExpWindowed(_,_,{a}L,{N}L,8)",
+        "QuantumArithmetic.LYY2021.ModExpWindowedUnary(_,_,{a}L,{N}L,3)",
+        "QuantumArithmetic.LYY2021.ModExpWindowedSelectSwap(_,_,{a}L,{N}L,4,4)",
         "QuantumArithmetic.LYY2021.ModExpWindowedMontgomery(_,_,{a}L,{N}L,8)",
+        'QuantumArithmetic.LYY2021.ModExpWindowedAuto(_,_,{a}L,{N}L,"t_count",-1)',
     ],
 )
 @pytest.mark.parametrize("n", [2, 3, 4, 5, 6, 7, 8, 9, 10, 16])
@@ -90,3 +95,96 @@ def test_ModMulMontgomery(n: int):
         op_n = f"{op}(_,_,_,{N}L)"
         tester = ArithmeticOpTester(op_n, [n, n, n])
         assert tester.run([x, y, 0]) == [x, y, (x * y * K) % N]
+
+
+@pytest.mark.parametrize("n,padding", [(3, 2), (4, 5), (6, 3)])
+def test_CosetEncode(n: int, padding: int):
+    N = 1 + 2 * random.randint(1, 2 ** (n - 1) - 1)
+    v = random.randint(0, N - 1)
+    program = f"""{{
+        use x = Qubit[{n + padding}];
+        ApplyXorInPlace({v}, x);
+        {LYY}.CosetEncode(x, {N}L, {padding});
+        let encoded = MeasureInteger(x);
+        ApplyXorInPlace(encoded, x);
+        {LYY}.CosetDecode(x, {N}L, {padding});
+        (encoded, MeasureInteger(x))
+    }}"""
+    encoded_values = set()
+    for encoded, decoded in CONTEXT.run(program, 20):
+        assert encoded % N == v and encoded < N * 2**padding
+        assert decoded == v
+        encoded_values.add(encoded)
+    assert len(encoded_values) > 1
+
+
+def _coset_program(n, padding, N, init, op) -> str:
+    # Runs op on y in coset representation with padding, and decodes y.
+    return f"""{{
+        use x = Qubit[{n}];
+        use y = Qubit[{n + padding}];
+        ApplyXorInPlace({init[0]}, x);
+        ApplyXorInPlace({init[1]}, y);
+        {LYY}.CosetEncode(y, {N}L, {padding});
+        {op};
+        {LYY}.CosetDecode(y, {N}L, {padding});
+        (MeasureInteger(x), MeasureInteger(y))
+    }}"""
+
+
+@pytest.mark.parametrize("n", [3, 5, 6])
+def test_CosetModAdd(n: int):
+    CONTEXT.set_quantum_seed(1)
+    N = random.randint(2, 2**n - 1)
+    a, b = random.randint(0, N - 1), random.randint(0, N - 1)
+    op = f"{LYY}.CosetModAdd(x, y, {N}L)"
+    results = CONTEXT.run(_coset_program(n, 8, N, (a, b), op), 5)
+    assert results == [(a, (a + b) % N)] * 5
+
+
+@pytest.mark.parametrize("n", [3, 5, 6])
+def test_CosetModMulByConstFast(n: int):
+    CONTEXT.set_quantum_seed(1)
+    N = 1 + 2 * random.randint(1, 2 ** (n - 1) - 1)
+    A, x = random.randint(0, N - 1), random.randint(0, 2**n - 1)
+    op = f"{LYY}.CosetModMulByConstFast(x, y, {A}L, {N}L)"
+    results = CONTEXT.run(_coset_program(n, 8, N, (x, 0), op), 5)
+    assert results == [(x, (A * x) % N)] * 5
+
+
+@pytest.mark.parametrize("n,window,mul_window", [(2, 2, 2), (3, 3, 1), (4, 2, 3)])
+def test_ModExpWindowedCoset(n: int, window: int, mul_window: int):
+    # Result is wrong with small probability, bounded by CosetDeviationBound.
+    CONTEXT.set_quantum_seed(1)
+    padding = 6
+    bound = CONTEXT.eval(
+        f"{LYY}.CosetDeviationBound({n},{n},{window},{mul_window},{padding})")
+    assert bound < 0.5
+    N = 1 + 2 * random.randint(1, 2 ** (n - 1) - 1)
+    a = test_utils.random_coprime(N) if N > 3 else 2
+    op = f"{LYY}.ModExpWindowedCoset(_,_,{a}L,{N}L,{window},{mul_window},{padding})"
+    tester = ArithmeticOpTester(op, [n, n])
+    correct = 0
+    for _ in range(10):
+        x = random.randint(0, 2**n - 1)
+        correct += tester.run([x, 0]) == [x, pow(a, x, mod=N)]
+    assert correct >= 10 * (1 - bound)
+
+
+@pytest.mark.parametrize(
+    "adder",
+    [
+        "Std.Arithmetic.RippleCarryTTKIncByLE",
+        "Std.Arithmetic.RippleCarryCGIncByLE",
+        'QuantumArithmetic.PrefixAdder.AddInPlace(_,_,"kogge_stone")',
+    ],
+)
+@pytest.mark.parametrize("n", [2, 3, 5, 8])
+def test_ModExpWithConfig(n: int, adder: str):
+    cfg = f"QuantumArithmetic.ArithmeticConfig.ConfigWithAdder({adder})"
+    N = 1 + 2 * random.randint(1, 2 ** (n - 1) - 1)
+    a = test_utils.random_coprime(N)
+    x = random.randint(0, 2**n - 1)
+    op = f"QuantumArithmetic.LYY2021.ModExpWithConfig(_,_,{a}L,{N}L,{cfg})"
+    tester = ArithmeticOpTester(op, [n, n])
+    assert tester.run([x, 0]) == [x, pow(a, x, mod=N)]
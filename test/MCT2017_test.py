@@ -5,6 +5,13 @@ import pytest
 from superposition_test_utils import check_superposition_binary
 from test_utils import ArithmeticOpTester
 
+ADDERS = [
+    "Std.Arithmetic.RippleCarryTTKIncByLE",
+    "Std.Arithmetic.RippleCarryCGIncByLE",
+    "QuantumArithmetic.CDKM2004.Add",
+    'QuantumArithmetic.PrefixAdder.AddInPlace(_,_,"kogge_stone")',
+]
+
 
 @pytest.mark.parametrize(
     "n1,n2",
@@ -25,14 +32,28 @@ from test_utils import ArithmeticOpTester
         (100, 100),
     ],
 )
-def test_Multiply(n1: int, n2: int):
-    tester = ArithmeticOpTester("QuantumArithmetic.MCT2017.Multiply", [n1, n2, n1 + n2])
+@pytest.mark.parametrize("name", ["Multiply", "MultiplyTOptimized"])
+def test_Multiply(n1: int, n2: int, name: str):
+    tester = ArithmeticOpTester(f"QuantumArithmetic.MCT2017.{name}", [n1, n2, n1 + n2])
     for _ in range(5):
         a = random.randint(0, 2**n1 - 1)
         b = random.randint(0, 2**n2 - 1)
         assert tester.run([a, b, 0]) == [a, b, a * b]
 
 
-def test_superposition():
-    op = "QuantumArithmetic.MCT2017.Multiply"
+@pytest.mark.parametrize("name", ["Multiply", "MultiplyTOptimized"])
+def test_superposition(name: str):
+    op = f"QuantumArithmetic.MCT2017.{name}"
     check_superposition_binary([8, 8, 16], op, lambda x, y: x * y)
+
+
+@pytest.mark.parametrize("adder", ADDERS)
+@pytest.mark.parametrize("n1,n2", [(1, 1), (2, 5), (7, 3), (16, 16)])
+def test_MultiplyWithConfig(n1: int, n2: int, adder: str):
+    cfg = f"QuantumArithmetic.ArithmeticConfig.ConfigWithAdder({adder})"
+    op = f"QuantumArithmetic.MCT2017.MultiplyWithConfig(_,_,_,{cfg})"
+    tester = ArithmeticOpTester(op, [n1, n2, n1 + n2])
+    for _ in range(5):
+        a = random.randint(0, 2**n1 - 1)
+        b = random.randint(0, 2**n2 - 1)
+        assert tester.run([a, b, 0]) == [a, b, a * b]
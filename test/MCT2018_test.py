@@ -5,6 +5,13 @@ import pytest
 
 from test_utils import ArithmeticOpTester
 
+ADDERS = [
+    "Std.Arithmetic.RippleCarryTTKIncByLE",
+    "Std.Arithmetic.RippleCarryCGIncByLE",
+    "QuantumArithmetic.CDKM2004.Add",
+    'QuantumArithmetic.PrefixAdder.AddInPlace(_,_,"kogge_stone")',
+]
+
 
 @pytest.mark.parametrize("n", [1, 2, 3, 4, 5, 6, 7, 8])
 def test_SquareRoot_Exhaustive(n: int):
@@ -37,3 +44,15 @@ def test_SquareRoot(n1: int, n2: int):
         x = random.randint(0, 2**n1 - 1)
         true_root = math.isqrt(x)
         assert tester.run([x, 0]) == [x - true_root**2, true_root]
+
+
+@pytest.mark.parametrize("adder", ADDERS)
+@pytest.mark.parametrize("n", [5, 8, 17])
+def test_SquareRootWithConfig(n: int, adder: str):
+    cfg = f"QuantumArithmetic.ArithmeticConfig.ConfigWithAdder({adder})"
+    op = f"QuantumArithmetic.MCT2018.SquareRootWithConfig(_,_,{cfg})"
+    tester = ArithmeticOpTester(op, [n, n])
+    for _ in range(5):
+        x = random.randint(0, 2**n - 1)
+        true_root = math.isqrt(x)
+        assert tester.run([x, 0]) == [x - true_root**2, true_root]
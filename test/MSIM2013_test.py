@@ -5,6 +5,13 @@ import pytest
 
 from test_utils import ArithmeticOpTester
 
+ADDERS = [
+    "Std.Arithmetic.RippleCarryTTKIncByLE",
+    "Std.Arithmetic.RippleCarryCGIncByLE",
+    "QuantumArithmetic.CDKM2004.Add",
+    'QuantumArithmetic.PrefixAdder.AddInPlace(_,_,"kogge_stone")',
+]
+
 
 @pytest.mark.parametrize("n", [2, 3])
 def test_GreatestCommonDivisor_exhaustive(n: int):
@@ -24,3 +31,119 @@ def test_GreatestCommonDivisor_random(n: int):
         x = g * random.randint(0, (2**n) // g - 1)
         y = g * random.randint(0, (2**n) // g - 1)
         assert tester.run([x, y, 0])[2] == math.gcd(x, y)
+
+
+@pytest.mark.parametrize("adder", ADDERS)
+@pytest.mark.parametrize("n", [3, 8, 16])
+def test_GreatestCommonDivisorWithConfig(n: int, adder: str):
+    cfg = f"QuantumArithmetic.ArithmeticConfig.ConfigWithAdder({adder})"
+    op = f"QuantumArithmetic.MSIM2013.GreatestCommonDivisorWithConfig(_,_,_,{cfg})"
+    tester = ArithmeticOpTester(op, [n, n, n])
+    for _ in range(3):
+        x, y = random.randint(0, 2**n - 1), random.randint(0, 2**n - 1)
+        assert tester.run([x, y, 0])[2] == math.gcd(x, y)
+
+
+def _signed(x: int, w: int) -> int:
+    return x - 2**w if x >= 2 ** (w - 1) else x
+
+
+@pytest.mark.parametrize("n", [1, 2, 3, 4])
+def test_BinaryGcd_exhaustive(n: int):
+    tester = ArithmeticOpTester("QuantumArithmetic.MSIM2013.BinaryGcd", [n, n, n])
+    (a, b, _), (a1, b1, ans) = tester.run_exhaustive([None, None, 0])
+    for i in range(len(a)):
+        assert (a1[i], b1[i], ans[i]) == (a[i], b[i], math.gcd(a[i], b[i]))
+
+
+@pytest.mark.parametrize("n", [5, 8, 16, 32, 64])
+def test_BinaryGcd_random(n: int):
+    tester = ArithmeticOpTester("QuantumArithmetic.MSIM2013.BinaryGcd", [n, n, n])
+    for _ in range(5):
+        g = random.randint(1, 2 ** (n // 2))
+        x = g * random.randint(0, (2**n) // g - 1)
+        y = g * random.randint(0, (2**n) // g - 1)
+        assert tester.run([x, y, 0]) == [x, y, math.gcd(x, y)]
+
+
+@pytest.mark.parametrize("adder", ADDERS)
+def test_BinaryGcdWithConfig(adder: str):
+    n = 12
+    cfg = f"QuantumArithmetic.ArithmeticConfig.ConfigWithAdder({adder})"
+    op = f"QuantumArithmetic.MSIM2013.BinaryGcdWithConfig(_,_,_,{cfg})"
+    tester = ArithmeticOpTester(op, [n, n, n])
+    for _ in range(3):
+        x, y = random.randint(0, 2**n - 1), random.randint(0, 2**n - 1)
+        assert tester.run([x, y, 0])[2] == math.gcd(x, y)
+
+
+def test_BinaryGcd_Controlled():
+    n = 8
+    op = "((c,a,b,ans)=>Controlled QuantumArithmetic.MSIM2013.BinaryGcd(c,(a,b,ans)))"
+    tester = ArithmeticOpTester(op, [2, n, n, n])
+    for ctrl in range(4):
+        x, y = 6 * random.randint(1, 40), 6 * random.randint(1, 40)
+        expected = math.gcd(x, y) if ctrl == 3 else 0
+        assert tester.run([ctrl, x, y, 0]) == [ctrl, x, y, expected]
+
+
+def test_BinaryGcd_Adjoint():
+    n = 8
+    op = "Adjoint QuantumArithmetic.MSIM2013.BinaryGcd"
+    tester = ArithmeticOpTester(op, [n, n, n])
+    for _ in range(3):
+        x, y = random.randint(0, 2**n - 1), random.randint(0, 2**n - 1)
+        assert tester.run([x, y, math.gcd(x, y)]) == [x, y, 0]
+
+
+def _check_bezout(n: int, x: int, y: int, result: list[int]):
+    w, t = 2 * n + 1, 2 * n - 1
+    g = math.gcd(x, y)
+    p, q = _signed(result[3], w), _signed(result[4], w)
+    assert result[:3] == [x, y, g]
+    assert p * x + q * y == g * 2**t
+
+
+@pytest.mark.parametrize("n", [1, 2, 3])
+def test_ExtendedBinaryGcd_exhaustive(n: int):
+    w = 2 * n + 1
+    op = "QuantumArithmetic.MSIM2013.ExtendedBinaryGcd"
+    tester = ArithmeticOpTester(op, [n, n, n, w, w])
+    for x in range(2**n):
+        for y in range(2**n):
+            _check_bezout(n, x, y, tester.run([x, y, 0, 0, 0]))
+
+
+@pytest.mark.parametrize("n", [4, 8, 16, 32])
+def test_ExtendedBinaryGcd_random(n: int):
+    w = 2 * n + 1
+    op = "QuantumArithmetic.MSIM2013.ExtendedBinaryGcd"
+    tester = ArithmeticOpTester(op, [n, n, n, w, w])
+    for _ in range(5):
+        x, y = random.randint(0, 2**n - 1), random.randint(0, 2**n - 1)
+        _check_bezout(n, x, y, tester.run([x, y, 0, 0, 0]))
+
+
+def test_ExtendedBinaryGcd_ModularInverse():
+    n, N = 10, 1009
+    w, t = 2 * n + 1, 2 * n - 1
+    op = "QuantumArithmetic.MSIM2013.ExtendedBinaryGcd"
+    tester = ArithmeticOpTester(op, [n, n, n, w, w])
+    for _ in range(3):
+        x = random.randint(1, N - 1)
+        p = _signed(tester.run([x, N, 0, 0, 0])[3], w)
+        inv = p * pow(2, -t, N) % N
+        assert x * inv % N == 1
+
+
+def test_ExtendedBinaryGcd_Controlled():
+    n, w = 6, 13
+    op = "((c,a,b,ans,p,q)=>Controlled QuantumArithmetic.MSIM2013.ExtendedBinaryGcd(c,(a,b,ans,p,q)))"
+    tester = ArithmeticOpTester(op, [2, n, n, n, w, w])
+    for ctrl in range(4):
+        x, y = random.randint(0, 2**n - 1), random.randint(0, 2**n - 1)
+        result = tester.run([ctrl, x, y, 0, 0, 0])
+        if ctrl == 3:
+            _check_bezout(n, x, y, result[1:])
+        else:
+            assert result == [ctrl, x, y, 0, 0, 0]
@@ -0,0 +1,233 @@
+import random
+
+import pytest
+
+import test_utils
+from test_utils import ArithmeticOpTester, eval_qsharp
+
+NS = "QuantumArithmetic.ModMulEngine"
+METHODS = [
+    ("doubling", 0),
+    ("modadd", 1),
+    ("modadd", 3),
+    ("barrett", 1),
+    ("barrett", 2),
+    ("barrett", 16),
+    ("montgomery", 1),
+    ("montgomery", 3),
+]
+
+
+def method(reduction: str, window: int) -> str:
+    return f'{NS}.MakeModMulMethod("{reduction}",{window})'
+
+
+@pytest.mark.parametrize("reduction,window", METHODS)
+@pytest.mark.parametrize("n", [2, 3, 5, 8])
+def test_ModMulByConst(reduction: str, window: int, n: int):
+    N = 1 + 2 * random.randint(1, 2 ** (n - 1) - 1)
+    a = test_utils.random_coprime(N) if N > 3 else 2
+    op = f"{NS}.ModMulByConst(_,{a}L,{N}L,{method(reduction, window)})"
+    tester = ArithmeticOpTester(op, [n])
+    for _ in range(5):
+        y = random.randint(0, N - 1)
+        assert tester.run([y]) == [(a * y) % N]
+
+
+@pytest.mark.parametrize("reduction", ["modadd", "barrett", "montgomery"])
+def test_ModMulByConst_Controlled(reduction: str):
+    n, N, a = 6, 53, 10
+    op = f"((c,y)=>Controlled {NS}.ModMulByConst(c,(y,{a}L,{N}L,{method(reduction, 2)})))"
+    tester = ArithmeticOpTester(op, [1, n])
+    for _ in range(5):
+        y = random.randint(0, N - 1)
+        assert tester.run([0, y]) == [0, y]
+        assert tester.run([1, y]) == [1, (a * y) % N]
+
+
+@pytest.mark.parametrize("reduction", ["modadd", "barrett", "montgomery"])
+def test_ModMulLookup_AllInputs(reduction: str):
+    # Inputs y>=N are allowed. Only Montgomery reduction needs odd N.
+    n, N = 5, 20 if reduction != "montgomery" else 21
+    op = f"{NS}.ModMulLookup([],_,_,[7L],{N}L,{method(reduction, 2)})"
+    tester = ArithmeticOpTester(op, [n, n])
+    for y in range(2**n):
+        assert tester.run([y, 0]) == [y, (7 * y) % N]
+
+
+@pytest.mark.parametrize("reduction", ["modadd", "barrett", "montgomery"])
+def test_ModMulLookupInPlace(reduction: str):
+    n, N = 7, 101
+    factors = [test_utils.random_coprime(N) for _ in range(4)]
+    table = ",".join(f"{f}L" for f in factors)
+    op = f"{NS}.ModMulLookupInPlace(_,_,[{table}],{N}L,{method(reduction, 3)})"
+    tester = ArithmeticOpTester(op, [2, n])
+    for _ in range(5):
+        e, y = random.randint(0, 3), random.randint(0, N - 1)
+        assert tester.run([e, y]) == [e, (factors[e] * y) % N]
+
+
+@pytest.mark.parametrize(
+    "reduction,window,exp_window",
+    [
+        ("doubling", 0, 1),
+        ("modadd", 2, 1),
+        ("modadd", 2, 3),
+        ("barrett", 2, 1),
+        ("barrett", 3, 2),
+        ("montgomery", 2, 1),
+        ("montgomery", 3, 2),
+    ],
+)
+@pytest.mark.parametrize("n", [2, 3, 5, 8])
+def test_ModExp(reduction: str, window: int, exp_window: int, n: int):
+    N = 1 + 2 * random.randint(1, 2 ** (n - 1) - 1)
+    a = test_utils.random_coprime(N) if N > 3 else 2
+    x = random.randint(0, 2**n - 1)
+    op = f"{NS}.ModExp(_,_,{a}L,{N}L,{exp_window},{method(reduction, window)})"
+    tester = ArithmeticOpTester(op, [n, n])
+    assert tester.run([x, 0]) == [x, pow(a, x, mod=N)]
+
+
+# QFT-based multiplication is simulated with rotations, so only small n.
+@pytest.mark.parametrize("n,N", [(2, 3), (3, 5), (3, 7)])
+def test_ModMulByConst_QFT(n: int, N: int):
+    op = f"{NS}.ModMulByConst(_,2L,{N}L,{method('qft', 0)})"
+    tester = ArithmeticOpTester(op, [n])
+    for y in range(N):
+        assert tester.run([y]) == [(2 * y) % N]
+
+
+def test_ModExp_QFT():
+    op = f"{NS}.ModExp(_,_,6L,7L,1,{method('qft', 0)})"
+    tester = ArithmeticOpTester(op, [3, 3])
+    assert tester.run([5, 0]) == [5, pow(6, 5, mod=7)]
+
+
+def test_ModMulLookup_Coset():
+    # Plain additions: result is congruent to the product, for any representative.
+    n, N, f = 8, 53, 20
+    op = f"{NS}.ModMulLookup([],_,_,[{f}L],{N}L,{method('coset', 3)})"
+    tester = ArithmeticOpTester(op, [n, n])
+    for _ in range(5):
+        y, c = random.randint(0, 2**n - 1), N * random.randint(0, 1)
+        _, ans = tester.run([y, c])
+        assert ans % N == (c + f * y) % N and ans >= c
+
+
+def test_ModMulByConst_RejectsCoset():
+    op = f"{NS}.ModMulByConst(_,3L,7L,{method('coset', 1)})"
+    with pytest.raises(Exception, match="coset-encoded"):
+        ArithmeticOpTester(op, [3]).run([1])
+
+
+def test_ModMulLookup_RejectsUnwindowed():
+    op = f"{NS}.ModMulLookup([],_,_,[3L],7L,{method('qft', 0)})"
+    with pytest.raises(Exception, match="doesn't support lookups"):
+        ArithmeticOpTester(op, [3, 3]).run([1, 0])
+
+
+@pytest.mark.parametrize(
+    "expr,reduction,window",
+    [
+        ("DoublingMethod()", "doubling", 0),
+        ("QftMethod()", "qft", 0),
+        ("ModAddMethod(3)", "modadd", 3),
+        ("CosetMethod(2)", "coset", 2),
+        ("BarrettMethod(4)", "barrett", 4),
+        ("MontgomeryMethod(5)", "montgomery", 5),
+    ],
+)
+def test_MethodConstructors(expr: str, reduction: str, window: int):
+    method = eval_qsharp(f"{NS}.{expr}")
+    assert (method.Reduction, method.Window) == (reduction, window)
+
+
+@pytest.mark.parametrize("reduction,window", [("barret", 2), ("Montgomery", 2), ("modadd", 0)])
+def test_MakeModMulMethod_RejectsInvalid(reduction: str, window: int):
+    with pytest.raises(Exception, match="Unknown reduction|Window must be positive"):
+        eval_qsharp(f'{NS}.MakeModMulMethod("{reduction}",{window})')
+
+
+def test_ModExp_RejectsUnknownReduction():
+    # Methods built without constructors are checked when used.
+    method = f'new {NS}.ModMulMethod {{ Reduction = "barret", Window = 2 }}'
+    with pytest.raises(Exception, match="Unknown reduction"):
+        ArithmeticOpTester(f"{NS}.ModExp(_,_,3L,7L,1,{method})", [3, 3]).run([1, 0])
+
+
+@pytest.mark.parametrize(
+    "op",
+    [
+        "QuantumArithmetic.LYY2021.ModExpWithMethod(_,_,{a}L,{N}L,{m})",
+        "QuantumArithmetic.PG2012.ModExpWithMethod(_,_,{a}L,{N}L,{m})",
+        "QuantumArithmetic.CG20192.ModExpWithMethod(_,_,{a}L,{N}L,2,{m})",
+    ],
+)
+@pytest.mark.parametrize("reduction,window", [("modadd", 2), ("barrett", 3), ("montgomery", 2)])
+@pytest.mark.parametrize("n", [4, 8])
+def test_ModExpWithMethod(op: str, reduction: str, window: int, n: int):
+    N = 1 + 2 * random.randint(1, 2 ** (n - 1) - 1)
+    a = test_utils.random_coprime(N) if N > 3 else 2
+    op = op.format(a=a, N=N, m=method(reduction, window))
+    tester = ArithmeticOpTester(op, [n, n])
+    for _ in range(3):
+        x = random.randint(0, 2**n - 1)
+        assert tester.run([x, 0]) == [x, pow(a, x, mod=N)]
+
+
+def test_ModExpWithMethod_QFT():
+    op = f"QuantumArithmetic.PG2012.ModExpWithMethod(_,_,6L,7L,{NS}.QftMethod())"
+    tester = ArithmeticOpTester(op, [3, 3])
+    assert tester.run([5, 0]) == [5, pow(6, 5, mod=7)]
+
+
+T_OPTIMIZED_CFG = (
+    "QuantumArithmetic.ArithmeticConfig.ConfigWithUncontrolledAdder(QuantumArithmetic.CDKM2004.AddTOptimized)"
+)
+
+
+@pytest.mark.parametrize(
+    "reduction,window,exp_window",
+    [("doubling", 0, 1), ("modadd", 2, 1), ("modadd", 2, 3), ("barrett", 3, 2), ("montgomery", 3, 2)],
+)
+@pytest.mark.parametrize("n", [3, 8])
+def test_ModExpWithConfig(reduction: str, window: int, exp_window: int, n: int):
+    N = 1 + 2 * random.randint(1, 2 ** (n - 1) - 1)
+    a = test_utils.random_coprime(N) if N > 3 else 2
+    x = random.randint(0, 2**n - 1)
+    op = f"{NS}.ModExpWithConfig(_,_,{a}L,{N}L,{exp_window},{method(reduction, window)},{T_OPTIMIZED_CFG})"
+    tester = ArithmeticOpTester(op, [n, n])
+    assert tester.run([x, 0]) == [x, pow(a, x, mod=N)]
+
+
+@pytest.mark.parametrize("reduction", ["doubling", "modadd", "barrett", "montgomery"])
+def test_ModMulByConstWithConfig_Controlled(reduction: str):
+    n, N, a = 6, 53, 10
+    op = f"((c,y)=>Controlled {NS}.ModMulByConstWithConfig(c,(y,{a}L,{N}L,{method(reduction, 2)},{T_OPTIMIZED_CFG})))"
+    tester = ArithmeticOpTester(op, [1, n])
+    for _ in range(3):
+        y = random.randint(0, N - 1)
+        assert tester.run([0, y]) == [0, y]
+        assert tester.run([1, y]) == [1, (a * y) % N]
+
+
+def test_ModMulLookupWithConfig_Coset():
+    n, N, f = 8, 53, 20
+    op = f"{NS}.ModMulLookupWithConfig([],_,_,[{f}L],{N}L,{method('coset', 3)},{T_OPTIMIZED_CFG})"
+    tester = ArithmeticOpTester(op, [n, n])
+    for _ in range(3):
+        y, c = random.randint(0, 2**n - 1), N * random.randint(0, 1)
+        _, ans = tester.run([y, c])
+        assert ans % N == (c + f * y) % N and ans >= c
+
+
+def test_ModMulLookupInPlaceWithConfig():
+    n, N = 7, 101
+    factors = [test_utils.random_coprime(N) for _ in range(4)]
+    table = ",".join(f"{f}L" for f in factors)
+    op = f"{NS}.ModMulLookupInPlaceWithConfig(_,_,[{table}],{N}L,{method('barrett', 3)},{T_OPTIMIZED_CFG})"
+    tester = ArithmeticOpTester(op, [2, n])
+    for _ in range(3):
+        e, y = random.randint(0, 3), random.randint(0, N - 1)
+        assert tester.run([e, y]) == [e, (factors[e] * y) % N]
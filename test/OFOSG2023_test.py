@@ -34,3 +34,49 @@ def test_MultiplyWallaceTree(n1: int, n2: int, op: str):
         a = random.randint(0, 2**n1 - 1)
         b = random.randint(0, 2**n2 - 1)
         assert tester.run([a, b, 0]) == [a, b, a * b]
+
+
+@pytest.mark.parametrize(
+    "n1,n2",
+    [(1, 1), (1, 5), (2, 2), (2, 16), (9, 2), (3, 4), (6, 8), (8, 8), (16, 16), (5, 16), (32, 32)],
+)
+@pytest.mark.parametrize("reduction", ["wallace", "dadda"])
+@pytest.mark.parametrize("recycle", ["false", "true"])
+def test_MultiplyTree(n1: int, n2: int, reduction: str, recycle: str):
+    op = f'((a,b,c)=>QuantumArithmetic.OFOSG2023.MultiplyTree(a,b,c,"{reduction}",{recycle}))'
+    tester = ArithmeticOpTester(op, [n1, n2, n1 + n2])
+    for _ in range(5):
+        a = random.randint(0, 2**n1 - 1)
+        b = random.randint(0, 2**n2 - 1)
+        c = random.randint(0, 2 ** (n1 + n2) - 1)
+        assert tester.run([a, b, c]) == [a, b, c ^ (a * b)]
+
+
+@pytest.mark.parametrize("recycle", ["false", "true"])
+def test_MultiplyTree_Controlled(recycle: str):
+    n1, n2 = 6, 5
+    op = f'((c,a,b,d)=>Controlled QuantumArithmetic.OFOSG2023.MultiplyTree(c,(a,b,d,"dadda",{recycle})))'
+    tester = ArithmeticOpTester(op, [1, n1, n2, n1 + n2])
+    for ctrl in [0, 1]:
+        a = random.randint(0, 2**n1 - 1)
+        b = random.randint(0, 2**n2 - 1)
+        assert tester.run([ctrl, a, b, 0]) == [ctrl, a, b, ctrl * a * b]
+
+
+@pytest.mark.parametrize(
+    "adder",
+    [
+        "ConfigWithAdder(Std.Arithmetic.RippleCarryCGIncByLE)",
+        "ConfigWithUncontrolledAdder(QuantumArithmetic.CDKM2004.AddTOptimized)",
+    ],
+)
+@pytest.mark.parametrize("n1,n2", [(1, 1), (3, 5), (8, 8)])
+def test_MultiplyTreeWithConfig(n1: int, n2: int, adder: str):
+    cfg = f"QuantumArithmetic.ArithmeticConfig.{adder}"
+    op = f'((a,b,c)=>QuantumArithmetic.OFOSG2023.MultiplyTreeWithConfig(a,b,c,"dadda",true,{cfg}))'
+    tester = ArithmeticOpTester(op, [n1, n2, n1 + n2])
+    for _ in range(5):
+        a = random.randint(0, 2**n1 - 1)
+        b = random.randint(0, 2**n2 - 1)
+        c = random.randint(0, 2 ** (n1 + n2) - 1)
+        assert tester.run([a, b, c]) == [a, b, c ^ (a * b)]
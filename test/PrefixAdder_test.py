@@ -0,0 +1,78 @@
+import random
+
+import pytest
+
+from superposition_test_utils import (
+    check_superposition_binary,
+    check_superposition_binary_inplace,
+)
+from test_utils import ArithmeticOpTester
+
+PA = "QuantumArithmetic.PrefixAdder"
+TOPOLOGIES = ["brent_kung", "kogge_stone", "sklansky", "han_carlson", "ladner_fischer"]
+
+
+@pytest.mark.parametrize("topology", TOPOLOGIES)
+@pytest.mark.parametrize("n", [1, 2, 3, 4, 5, 8, 16, 31, 32])
+def test_AddInPlace(n: int, topology: str):
+    op = f'((a,b)=>{PA}.AddInPlace(a,b,"{topology}"))'
+    tester = ArithmeticOpTester(op, [n, n])
+    for _ in range(5):
+        a = random.randint(0, 2**n - 1)
+        b = random.randint(0, 2**n - 1)
+        assert tester.run([a, b]) == [a, (a + b) % (2**n)]
+
+
+@pytest.mark.parametrize("topology", TOPOLOGIES)
+@pytest.mark.parametrize("n", [1, 2, 3, 5, 8, 17, 32])
+def test_AddInPlaceWithCarry(n: int, topology: str):
+    op = f'((a,b,c)=>{PA}.AddInPlaceWithCarry(a,b,c[0],"{topology}"))'
+    tester = ArithmeticOpTester(op, [n, n, 1])
+    for _ in range(5):
+        a = random.randint(0, 2**n - 1)
+        b = random.randint(0, 2**n - 1)
+        assert tester.run([a, b, 0]) == [a, (a + b) % (2**n), (a + b) // (2**n)]
+
+
+@pytest.mark.parametrize("topology", TOPOLOGIES)
+@pytest.mark.parametrize("n", [1, 2, 3, 4, 5, 8, 16, 31, 32])
+def test_Add(n: int, topology: str):
+    op = f'((a,b,c)=>{PA}.Add(a,b,c,"{topology}"))'
+    tester = ArithmeticOpTester(op, [n, n, n])
+    for _ in range(5):
+        a = random.randint(0, 2**n - 1)
+        b = random.randint(0, 2**n - 1)
+        assert tester.run([a, b, 0]) == [a, b, (a + b) % (2**n)]
+
+
+@pytest.mark.parametrize("topology", TOPOLOGIES)
+@pytest.mark.parametrize("n", [1, 2, 3, 5, 8, 17, 32])
+def test_AddWithCarry(n: int, topology: str):
+    op = f'((a,b,c)=>{PA}.AddWithCarry(a,b,c[0..{n - 1}],c[{n}],"{topology}"))'
+    tester = ArithmeticOpTester(op, [n, n, n + 1])
+    for _ in range(5):
+        a = random.randint(0, 2**n - 1)
+        b = random.randint(0, 2**n - 1)
+        assert tester.run([a, b, 0]) == [a, b, a + b]
+
+
+@pytest.mark.parametrize("topology", TOPOLOGIES)
+def test_AddInPlace_Controlled(topology: str):
+    n = 8
+    op = f'((c,a,b)=>Controlled {PA}.AddInPlace(c,(a,b,"{topology}")))'
+    tester = ArithmeticOpTester(op, [1, n, n])
+    for ctrl in [0, 1]:
+        a = random.randint(0, 2**n - 1)
+        b = random.randint(0, 2**n - 1)
+        assert tester.run([ctrl, a, b]) == [ctrl, a, (b + ctrl * a) % (2**n)]
+
+
+@pytest.mark.parametrize("topology", TOPOLOGIES)
+def test_superposition(topology: str):
+    n = 6
+    check_superposition_binary_inplace(
+        n, f'((a,b)=>{PA}.AddInPlace(a,b,"{topology}"))', lambda x, y: (x + y) % (2**n)
+    )
+    check_superposition_binary(
+        [n, n, n], f'((a,b,c)=>{PA}.Add(a,b,c,"{topology}"))', lambda x, y: (x + y) % (2**n)
+    )
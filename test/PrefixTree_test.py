@@ -0,0 +1,58 @@
+import random
+
+import pytest
+
+from test_utils import eval_qsharp
+
+PT = "QuantumArithmetic.PrefixTree"
+TOPOLOGIES = ["brent_kung", "kogge_stone", "sklansky", "han_carlson", "ladner_fischer"]
+
+
+def _schedule_stats(m, topology):
+    levels = eval_qsharp(f'{PT}.PrefixLevels({m},"{topology}")')
+    levels = [level for level in levels if len(level) > 0]
+    return len(levels), sum(len(level) for level in levels)
+
+
+@pytest.mark.parametrize("topology", TOPOLOGIES)
+@pytest.mark.parametrize("m", [1, 2, 3, 5, 8, 13, 16, 33, 100])
+def test_BuildPrefixSchedule_CoversAllPositions(m: int, topology: str):
+    # Fails if some position doesn't get a carry from position 0.
+    eval_qsharp(f'{PT}.BuildPrefixSchedule({m},"{topology}")')
+
+
+@pytest.mark.parametrize(
+    "topology,levels,nodes",
+    [
+        ("brent_kung", 7, 26),
+        ("kogge_stone", 4, 49),
+        ("sklansky", 4, 32),
+        ("han_carlson", 5, 32),
+        ("ladner_fischer", 5, 27),
+    ],
+)
+def test_PrefixLevels_Sizes(topology: str, levels: int, nodes: int):
+    assert _schedule_stats(16, topology) == (levels, nodes)
+
+
+@pytest.mark.parametrize("exclusive", [True, False])
+def test_BuildPrefixTree_Sizes(exclusive: bool):
+    # 26 nodes, 11 of them need propagate bits. With OR, every node needs a new
+    # generate bit, and nodes share 8 temporary qubits.
+    tree = f'{PT}.BuildPrefixTree(16,"brent_kung",{str(exclusive).lower()})'
+    assert eval_qsharp(f"{tree}.NumAncillas") == (11 if exclusive else 26 + 11 + 8)
+
+
+@pytest.mark.parametrize("exclusive", [True, False])
+@pytest.mark.parametrize("topology", TOPOLOGIES)
+@pytest.mark.parametrize("n", [1, 2, 3, 5, 8, 13, 32])
+def test_ApplyPrefixTree(n: int, topology: str, exclusive: bool):
+    op = "QuantumArithmetic.PrefixTreeTest.TestApplyPrefixTree"
+    for _ in range(5):
+        a = random.randint(0, 2**n - 1)
+        b = random.randint(0, 2**n - 1)
+        expected = sum(
+            (((a % 2 ** (i + 1)) + (b % 2 ** (i + 1))) >> (i + 1)) << i for i in range(n)
+        )
+        ex = str(exclusive).lower()
+        assert eval_qsharp(f'{op}({n},"{topology}",{ex},{a}L,{b}L)') == expected
@@ -16,6 +16,29 @@ def test_Add(n: int):
         assert ans == [x, (x + y) % (2**n), y, (x + y) // (2**n)]
 
 
+@pytest.mark.parametrize("num_controls", [1, 2])
+@pytest.mark.parametrize("n", [2, 3, 8, 17])
+def test_Add_Controlled(n: int, num_controls: int):
+    op = "((c,a,b,p,z)=>Controlled QuantumArithmetic.SC2023.Add(c,(a,b,p,z[0])))"
+    tester = ArithmeticOpTester(op, [num_controls, n, n, n, 1])
+    for ctrl in range(2**num_controls):
+        x, y = random.randint(0, 2**n - 1), random.randint(0, 2**n - 1)
+        if ctrl == 2**num_controls - 1:
+            expected = [ctrl, x, (x + y) % (2**n), y, (x + y) // (2**n)]
+        else:
+            expected = [ctrl, x, y, 0, 0]
+        assert tester.run([ctrl, x, y, 0, 0]) == expected
+
+
+def test_Add_Adjoint():
+    n = 9
+    op = "((a,b,c,d)=>Adjoint QuantumArithmetic.SC2023.Add(a,b,c,d[0]))"
+    tester = ArithmeticOpTester(op, [n, n, n, 1])
+    for _ in range(5):
+        x, y = random.randint(0, 2**n - 1), random.randint(0, 2**n - 1)
+        assert tester.run([x, (x + y) % (2**n), y, (x + y) // (2**n)]) == [x, y, 0, 0]
+
+
 @pytest.mark.parametrize("n", [3, 32, 63])
 def test_Add_Mod2N(n: int):
     tester = ArithmeticOpTester("QuantumArithmetic.SC2023.Add_Mod2N", [n, n, n])
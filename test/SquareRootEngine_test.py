@@ -0,0 +1,93 @@
+import math
+import random
+
+import pytest
+
+from test_utils import ArithmeticOpTester
+
+E = "QuantumArithmetic.SquareRootEngine"
+
+METHODS = [
+    ("nonrestoring", 0, "mct"),
+    ("windowed", 0, "mct"),
+    ("windowed", 1, "mct"),
+    ("windowed", 3, "mct"),
+    ("newton", 3, "mct"),
+    ("newton", 5, "mct"),
+]
+
+
+def _method(alg: str, k: int, mul: str) -> str:
+    return f'new {E}.SqrtMethod {{ Algorithm = "{alg}", LookupBits = {k}, Multiplier = "{mul}" }}'
+
+
+@pytest.mark.parametrize("alg,k,mul", METHODS)
+@pytest.mark.parametrize("n", [1, 2, 3, 4, 5, 6])
+def test_SquareRoot_Exhaustive(n: int, alg: str, k: int, mul: str):
+    tester = ArithmeticOpTester(f"{E}.SquareRoot(_,_,{_method(alg, k, mul)})", [n, (n + 1) // 2])
+    for x in range(2**n):
+        r = math.isqrt(x)
+        assert tester.run([x, 0]) == [x - r * r, r]
+
+
+@pytest.mark.parametrize("alg,k,mul", METHODS)
+@pytest.mark.parametrize("n1,n2", [(9, 5), (10, 8), (16, 8), (33, 17), (64, 32), (100, 50)])
+def test_SquareRoot(n1: int, n2: int, alg: str, k: int, mul: str):
+    tester = ArithmeticOpTester(f"{E}.SquareRoot(_,_,{_method(alg, k, mul)})", [n1, n2])
+    values = [0, 2**n1 - 1, math.isqrt(2**n1 - 1) ** 2 - 1]
+    values += [random.randint(0, 2**n1 - 1) for _ in range(4)]
+    for x in values:
+        r = math.isqrt(x)
+        assert tester.run([x, 0]) == [x - r * r, r]
+
+
+@pytest.mark.parametrize("mul", ["schoolbook", "tree", "karatsuba"])
+@pytest.mark.parametrize("n", [4, 9, 17])
+def test_SquareRoot_Newton_Multipliers(n: int, mul: str):
+    tester = ArithmeticOpTester(f"{E}.SquareRoot(_,_,{_method('newton', 4, mul)})", [n, (n + 1) // 2])
+    for _ in range(3):
+        x = random.randint(0, 2**n - 1)
+        r = math.isqrt(x)
+        assert tester.run([x, 0]) == [x - r * r, r]
+
+
+@pytest.mark.parametrize(
+    "adder",
+    [
+        "Std.Arithmetic.RippleCarryTTKIncByLE",
+        "QuantumArithmetic.CDKM2004.Add",
+    ],
+)
+@pytest.mark.parametrize("alg,k,mul", [("windowed", 2, "mct"), ("newton", 4, "mct")])
+def test_SquareRootWithConfig(alg: str, k: int, mul: str, adder: str):
+    n = 17
+    cfg = f"QuantumArithmetic.ArithmeticConfig.ConfigWithAdder({adder})"
+    op = f"{E}.SquareRootWithConfig(_,_,{_method(alg, k, mul)},{cfg})"
+    tester = ArithmeticOpTester(op, [n, 9])
+    for _ in range(5):
+        x = random.randint(0, 2**n - 1)
+        r = math.isqrt(x)
+        assert tester.run([x, 0]) == [x - r * r, r]
+
+
+@pytest.mark.parametrize("alg,k,mul", METHODS)
+def test_SquareRoot_Adjoint(alg: str, k: int, mul: str):
+    n = 12
+    op = f"((r,a)=>Adjoint {E}.SquareRoot(r,a,{_method(alg, k, mul)}))"
+    tester = ArithmeticOpTester(op, [n, n // 2])
+    for _ in range(4):
+        x = random.randint(0, 2**n - 1)
+        r = math.isqrt(x)
+        assert tester.run([x - r * r, r]) == [x, 0]
+
+
+@pytest.mark.parametrize("alg,k,mul", METHODS)
+def test_SquareRoot_Controlled(alg: str, k: int, mul: str):
+    n = 10
+    op = f"((c,r,a)=>Controlled {E}.SquareRoot(c,(r,a,{_method(alg, k, mul)})))"
+    tester = ArithmeticOpTester(op, [2, n, n // 2])
+    for ctrl in [0, 1, 2, 3]:
+        x = random.randint(0, 2**n - 1)
+        r = math.isqrt(x)
+        expected = [3, x - r * r, r] if ctrl == 3 else [ctrl, x, 0]
+        assert tester.run([ctrl, x, 0]) == expected
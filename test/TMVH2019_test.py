@@ -18,7 +18,7 @@ from test_utils import ArithmeticOpTester, eval_qsharp
 @pytest.mark.parametrize("n", [2, 4, 8, 16])
 def test_division(div_type: str, adder: str, n: int):
     op = f"QuantumArithmetic.TMVH2019Test.Test_{div_type}"
-    cfg = "new QuantumArithmetic.TMVH2019.Config{Adder=" + adder + "}"
+    cfg = f"QuantumArithmetic.ArithmeticConfig.ConfigWithAdder({adder})"
     for _ in range(5):
         x, y = random.randint(0, 2**n - 1), random.randint(1, 2 ** (n - 1) - 1)
         q, r = eval_qsharp(f"{op}({n},{x}L,{y}L,{cfg})")
@@ -31,7 +31,7 @@ def test_division_with_QFT_Adder(div_type: str):
     adder = "Std.Arithmetic.FourierTDIncByLE"
     n = 5
     op = f"QuantumArithmetic.TMVH2019Test.Test_{div_type}"
-    cfg = "new QuantumArithmetic.TMVH2019.Config{Adder=" + adder + "}"
+    cfg = f"QuantumArithmetic.ArithmeticConfig.ConfigWithAdder({adder})"
     for _ in range(2):
         x, y = random.randint(0, 2**n - 1), random.randint(1, 2 ** (n - 1) - 1)
         q, r = eval_qsharp(f"{op}({n},{x}L,{y}L,{cfg})")
@@ -44,7 +44,7 @@ def test_division_large(div_type: str):
     adder = "Std.Arithmetic.RippleCarryCGIncByLE"
     n = 100
     op = f"QuantumArithmetic.TMVH2019Test.Test_{div_type}"
-    cfg = "new QuantumArithmetic.TMVH2019.Config{Adder=" + adder + "}"
+    cfg = f"QuantumArithmetic.ArithmeticConfig.ConfigWithAdder({adder})"
     for _ in range(5):
         x, y = random.randint(0, 2**n - 1), random.randint(1, 2 ** (n - 1) - 1)
         q, r = eval_qsharp(f"{op}({n},{x}L,{y}L,{cfg})")
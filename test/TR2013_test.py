@@ -5,8 +5,9 @@ import pytest
 from test_utils import ArithmeticOpTester
 
 @pytest.mark.parametrize("n", [1, 2, 3, 4, 5, 8, 16, 19])
-def test_Add(n: int):
-    tester = ArithmeticOpTester("QuantumArithmetic.TR2013.Add", [n, n])
+@pytest.mark.parametrize("name", ["Add", "AddTOptimized"])
+def test_Add(n: int, name: str):
+    tester = ArithmeticOpTester(f"QuantumArithmetic.TR2013.{name}", [n, n])
     for _ in range(5):
         a = random.randint(0, 2**n - 1)
         b = random.randint(0, 2**n - 1)
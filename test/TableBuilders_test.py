@@ -0,0 +1,57 @@
+import random
+
+import pytest
+
+from test_utils import CONTEXT
+
+
+def _table(expr: str) -> list[int]:
+    return CONTEXT.eval(f"QuantumArithmetic.TableBuilders.{expr}")
+
+
+@pytest.mark.parametrize("size", [1, 2, 16, 100])
+def test_PowerTable(size: int):
+    N = random.randint(2, 2**70)
+    base = random.randint(0, N - 1)
+    assert _table(f"PowerTable({base}L, {N}L, {size})") == [
+        pow(base, j, N) for j in range(size)
+    ]
+
+
+@pytest.mark.parametrize("size", [1, 2, 16, 100])
+def test_MultiplesTable(size: int):
+    factor = random.randint(0, 2**70)
+    assert _table(f"MultiplesTable({factor}L, {size})") == [
+        j * factor for j in range(size)
+    ]
+
+
+@pytest.mark.parametrize("m1,m2", [(0, 1), (1, 0), (2, 3), (4, 4)])
+@pytest.mark.parametrize("sign", [1, -1])
+def test_ModExpMulTable(m1: int, m2: int, sign: int):
+    N = random.randint(2, 2**70)
+    factor, base = random.randint(1, N - 1), random.randint(1, N - 1)
+    expected = [
+        (sign * factor * k * pow(base, j, N)) % N
+        for k in range(2**m2)
+        for j in range(2**m1)
+    ]
+    table = _table(f"ModExpMulTable({sign * factor}L, {base}L, {N}L, {m1}, {m2})")
+    assert table == expected
+
+
+@pytest.mark.parametrize("num_factors,bits", [(1, 1), (1, 5), (4, 3), (8, 0)])
+def test_ProductsTable(num_factors: int, bits: int):
+    N = random.randint(2, 2**70)
+    factors = [random.randint(0, N - 1) for _ in range(num_factors)]
+    scale = random.randint(1, 2**80)
+    expected = [(f * v * scale) % N for v in range(2**bits) for f in factors]
+    factors_str = ",".join(f"{f}L" for f in factors)
+    table = _table(f"ProductsTable([{factors_str}], {scale}L, {N}L, {bits})")
+    assert table == expected
+
+
+def test_TableAsBits():
+    table = [0, 1, 6, 2**64 + 5]
+    bits = _table(f"TableAsBits([{','.join(f'{v}L' for v in table)}], 66)")
+    assert bits == [[bool((v >> i) & 1) for i in range(66)] for v in table]
@@ -1,13 +1,84 @@
 import math
+import random
 
 import pytest
 
-from test_utils import ArithmeticOpTester
+from test_utils import CONTEXT, ArithmeticOpTester
 
 
 @pytest.mark.parametrize("n1,n2", [(2, 3), (3, 13), (4, 41)])
 def test_Factorial(n1: int, n2: int):
     op = "QuantumArithmetic.TableFunctions.Factorial"
     tester = ArithmeticOpTester(op, [n1, n2])
-    for i in range(2**n1):
-        assert tester.run([i, 0]) == [i, math.factorial(i)]
+    results = tester.run_batch([[i, 0] for i in range(2**n1)])
+    assert results == [[i, math.factorial(i)] for i in range(2**n1)]
+
+
+def _random_table(m: int, w: int) -> tuple[list[int], str]:
+    table = [random.randint(0, 2**w - 1) for _ in range(2**m)]
+    return table, "[" + ",".join(f"{v}L" for v in table) + "]"
+
+
+@pytest.mark.parametrize("m,w", [(1, 3), (2, 4), (3, 5), (5, 3)])
+@pytest.mark.parametrize(
+    "op",
+    [
+        "TableLookupUnary(_,_,{table})",
+        "TableLookupSelectSwap(_,_,{table},1)",
+        "TableLookupSelectSwap(_,_,{table},2)",
+        "TableLookupSelectSwap(_,_,{table},{all})",
+    ],
+)
+def test_TableLookup_variants(m: int, w: int, op: str):
+    table, table_str = _random_table(m, w)
+    op = "QuantumArithmetic.TableFunctions." + op.format(table=table_str, all=2**m)
+    tester = ArithmeticOpTester(op, [m, w])
+    inputs = [[i, y] for i in range(2**m) for y in [0, 2**w - 1]]
+    assert tester.run_batch(inputs) == [[i, y ^ table[i]] for i, y in inputs]
+
+
+@pytest.mark.parametrize(
+    "op",
+    [
+        "TableLookup(a,t,{table})",
+        "TableLookupUnary(a,t,{table})",
+        "TableLookupSelectSwap(a,t,{table},2)",
+    ],
+)
+@pytest.mark.parametrize("num_controls", [2, 3])
+@pytest.mark.parametrize("m", [1, 3])
+def test_TableLookup_MultiControlled(m: int, num_controls: int, op: str):
+    w = 4
+    table, table_str = _random_table(m, w)
+    name, args = op.format(table=table_str).split("(", 1)
+    op = f"((c,a,t)=>Controlled QuantumArithmetic.TableFunctions.{name}(c,({args}))"
+    tester = ArithmeticOpTester(op, [num_controls, m, w])
+    all_ones = 2**num_controls - 1
+    inputs = [[c, i, 0] for c in range(2**num_controls) for i in range(2**m)]
+    expected = [[c, i, table[i] if c == all_ones else 0] for c, i, _ in inputs]
+    assert tester.run_batch(inputs) == expected
+
+
+@pytest.mark.parametrize("num_controls", [1, 3])
+@pytest.mark.parametrize("m,w", [(1, 3), (2, 4), (3, 5), (4, 6), (5, 3)])
+def test_TableLookupUnary_uncompute_phases(m: int, w: int, num_controls: int):
+    # Lookup and measurement-based unlookup must restore the address register
+    # exactly, including phases, so H-lookup-unlookup-H maps |0> to |0>.
+    _, table = _random_table(m, w)
+    op = "QuantumArithmetic.TableFunctions.TableLookupUnary"
+    program = f"""{{
+        use c = Qubit[{num_controls}];
+        use a = Qubit[{m}];
+        use t = Qubit[{w}];
+        ApplyToEach(H, c);
+        ApplyToEach(H, a);
+        {op}(a, t, {table});
+        Adjoint {op}(a, t, {table});
+        Controlled {op}(c, (a, t, {table}));
+        Controlled Adjoint {op}(c, (a, t, {table}));
+        ApplyToEach(H, a);
+        ApplyToEach(H, c);
+        (MeasureInteger(c), MeasureInteger(a), MeasureInteger(t))
+    }}"""
+    for result in CONTEXT.run(program, 10):
+        assert result == (0, 0, 0)
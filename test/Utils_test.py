@@ -25,6 +25,15 @@ def test_RotateLeft(n: int):
         assert tester.run([x])[0] == (x % (2 ** (n - 1)) << 1) + (x >> (n - 1))
 
 
+@pytest.mark.parametrize("n", [1, 5, 8])
+def test_RotateRightBy(n: int):
+    for r in range(n + 2):
+        tester = ArithmeticOpTester(f"QuantumArithmetic.Utils.RotateRightBy(_,{r})", [n])
+        x = random.randint(0, 2**n - 1)
+        s = r % n
+        assert tester.run([x])[0] == (x >> s) | ((x << (n - s)) % 2**n)
+
+
 @pytest.mark.parametrize("n", [8, 16])
 def test_Subtract(n: int):
     tester = ArithmeticOpTester("QuantumArithmetic.Utils.Subtract", [n, n])
@@ -34,6 +43,15 @@ def test_Subtract(n: int):
         assert tester.run([x, y]) == [x, (y - x) % (2**n)]
 
 
+
+@pytest.mark.parametrize("n,m", [(1, 1), (8, 8), (8, 5)])
+def test_ComputeCarries(n: int, m: int):
+    tester = ArithmeticOpTester("QuantumArithmetic.Utils.ComputeCarries", [n, n, m])
+    for _ in range(5):
+        x, y = random.randint(0, 2**n - 1), random.randint(0, 2**n - 1)
+        carries = sum(((x % 2 ** (i + 1) + y % 2 ** (i + 1)) >> (i + 1)) << i for i in range(m))
+        assert tester.run([x, y, 0]) == [x, y, carries]
+
 def test_superposition_RotateRight():
     n = 8
     op = "QuantumArithmetic.Utils.RotateRight"
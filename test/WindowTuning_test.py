@@ -0,0 +1,77 @@
+import pytest
+
+from test_utils import CONTEXT
+
+WT = "QuantumArithmetic.WindowTuning"
+TARGETS = ["qubits", "depth", "t_count", "volume"]
+
+
+def _num_ancillas(op: str, n: int) -> int:
+    counts = CONTEXT.logical_counts(f"EstimateUtils.RunModExp({n},{op})")
+    return counts["numQubits"] - 2 * n
+
+
+@pytest.mark.parametrize("n", [8, 16, 32, 256, 2048])
+@pytest.mark.parametrize("target", TARGETS)
+def test_OptimalLYY2021Window(n: int, target: str):
+    model = f"{WT}.LYY2021CostModel()"
+    m = CONTEXT.eval(f'{WT}.OptimalLYY2021Window({n},{n},"{target}",-1,{model})')
+    assert 1 <= m <= min(n, 20)
+
+
+@pytest.mark.parametrize("n", [8, 16, 32])
+@pytest.mark.parametrize("target", TARGETS)
+def test_OptimalLYY2021Window_respects_budget(n: int, target: str):
+    model = f"{WT}.LYY2021CostModel()"
+    # Ancillas of LYY2021.ModExpWindowed are 2*n*ceil(n/m)+2*n+4.
+    budget = 2 * n * 2 + 2 * n + 4
+    m = CONTEXT.eval(
+        f'{WT}.OptimalLYY2021Window({n},{n},"{target}",{budget},{model})'
+    )
+    assert -(-n // m) <= 2
+
+
+@pytest.mark.parametrize("n", [16, 64])
+def test_OptimalLYY2021Window_prefers_about_2_log_n(n: int):
+    model = f"{WT}.LYY2021CostModel()"
+    m = CONTEXT.eval(f'{WT}.OptimalLYY2021Window({n},{n},"t_count",-1,{model})')
+    assert abs(m - 2 * n.bit_length()) <= 3
+
+
+@pytest.mark.parametrize("n", [16, 32, 256])
+@pytest.mark.parametrize("target", TARGETS)
+def test_OptimalCG20192Windows(n: int, target: str):
+    model = f"{WT}.CG20192CostModel()"
+    e, w = CONTEXT.eval(
+        f'{WT}.OptimalCG20192Windows({n},{n},"{target}",-1,{model})'
+    )
+    assert 1 <= e <= 10 and 1 <= w <= 20 - e
+
+
+def test_OptimalWindow_fails_if_budget_too_small():
+    model = f"{WT}.LYY2021CostModel()"
+    with pytest.raises(Exception, match="No window size fits"):
+        CONTEXT.eval(f'{WT}.OptimalLYY2021Window(16,16,"t_count",10,{model})')
+
+
+@pytest.mark.parametrize("n,m", [(8, 3), (12, 4)])
+def test_LYY2021CostModel_ancillas(n: int, m: int):
+    op = f"QuantumArithmetic.LYY2021.ModExpWindowed(_,_,_,_,{m})"
+    _, ancilla_features = CONTEXT.eval(f"{WT}.LYY2021Features({n},{n},{m})")
+    coefs = [2.0, 2.0, 4.0]
+    predicted = sum(c * f for c, f in zip(coefs, ancilla_features))
+    assert predicted == _num_ancillas(op, n)
+
+
+@pytest.mark.parametrize("model", ["LYY2021CostModel", "CG20192CostModel"])
+def test_default_models_fitted_range(model: str):
+    assert CONTEXT.eval(f"{WT}.{model}().MinN") == 8
+    assert CONTEXT.eval(f"{WT}.{model}().MaxN") == 32
+
+
+@pytest.mark.parametrize("n,extrapolated", [(4, True), (8, False), (32, False), (256, True)])
+def test_OptimalWindow_warns_if_extrapolated(n: int, extrapolated: bool):
+    for optimizer, model in [("OptimalLYY2021Window", "LYY2021CostModel"), ("OptimalCG20192Windows", "CG20192CostModel")]:
+        ans = CONTEXT.eval(f'{WT}.{optimizer}({n},{n},"t_count",-1,{WT}.{model}())', save_events=True)
+        warned = any("extrapolated" in m for m in ans["messages"])
+        assert warned == extrapolated
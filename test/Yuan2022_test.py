@@ -3,6 +3,13 @@ import random
 import pytest
 from test_utils import ArithmeticOpTester
 
+ADDERS = [
+    "Std.Arithmetic.RippleCarryTTKIncByLE",
+    "Std.Arithmetic.RippleCarryCGIncByLE",
+    "QuantumArithmetic.CDKM2004.Add",
+    'QuantumArithmetic.PrefixAdder.AddInPlace(_,_,"kogge_stone")',
+]
+
 
 @pytest.mark.parametrize("n", [3, 4, 7, 8, 9, 11, 12])
 def test_subtract_equal(n: int):
@@ -37,3 +44,16 @@ def test_division(n: int):
         y = random.randint(2 ** (m - 1), 2**m - 1)
         ans = tester.run([x, y, 0])
         assert ans == [x % y, y, x // y]
+
+
+@pytest.mark.parametrize("adder", ADDERS)
+@pytest.mark.parametrize("n", [4, 9, 16])
+def test_division_with_config(n: int, adder: str):
+    cfg = f"QuantumArithmetic.ArithmeticConfig.ConfigWithAdder({adder})"
+    op = f"QuantumArithmetic.Yuan2022.DivideWithConfig(_,_,_,{cfg})"
+    m = n // 2
+    tester = ArithmeticOpTester(op, [n, m, n - m + 1])
+    for _ in range(5):
+        x = random.randint(2**m - 1, 2**n - 1)
+        y = random.randint(2 ** (m - 1), 2**m - 1)
+        assert tester.run([x, y, 0]) == [x % y, y, x // y]
@@ -0,0 +1,297 @@
+"""Classical simulation of reversible circuits on computational basis states.
+
+Most operations in the library are built from X, CNOT, CCNOT, SWAP and AND,
+whose adjoint uncomputes by measuring in X basis and fixing up the phase. On
+basis-state inputs such circuits map bit strings to bit strings, so they can be
+evaluated without a quantum simulator. An operation is traced once (on all-zero
+inputs, by `TestUtils.TraceArithmeticOp`) into a flat gate list, which is then
+replayed on classical bits.
+"""
+
+import json
+import sys
+from array import array
+
+from qdk.qsharp import CircuitGenerationMethod
+
+# Ops for which classical simulation was not possible, with the reason.
+FALLBACKS: dict[str, str] = {}
+
+# Opcodes of the compiled gate list.
+X, CX, CCX, MCX, SWAP, CSWAP, MEASURE, MEASURE_X, RESET, READ = range(10)
+
+# Qubit states tracked during compilation. Qubit in the HADAMARD state is H
+# applied to a basis state, and we keep track of that basis state.
+_BASIS, _HADAMARD, _MIXED = range(3)
+
+# Single-qubit diagonal gates other than Z.
+_PHASE_GATES = {"S", "T", "Rz", "R1"}
+
+
+# Maps ASCII digits "0" and "1" to bytes 0 and 1.
+_ASCII_BIT = bytes.maketrans(b"01", b"\x00\x01")
+
+
+class NotClassicalError(Exception):
+    """Circuit can't be simulated classically on basis states."""
+
+
+class TraceMismatchError(Exception):
+    """Measurement outcome differs from the traced one, so trace is not valid."""
+
+
+def _qubits(refs) -> list[int]:
+    return [ref["qubit"] for ref in refs]
+
+
+def _controlled_x(controls: list[int], target: int) -> tuple:
+    if len(controls) == 0:
+        return (X, target)
+    elif len(controls) == 1:
+        return (CX, controls[0], target)
+    elif len(controls) == 2:
+        return (CCX, controls[0], controls[1], target)
+    return (MCX, tuple(controls), target)
+
+
+def compile_circuit(circuit_json: str) -> tuple[list[tuple], int]:
+    """Converts circuit JSON into a list of classical gates.
+
+    Marker gates Rx(k) added by `TestUtils.TraceArithmeticOp` become READ gates,
+    which read k-th bit of the result.
+
+    Returns gate list and number of qubits. Raises NotClassicalError if a qubit
+    in superposition affects other qubits.
+    """
+    circuit = json.loads(circuit_json)
+    num_qubits = len(circuit["qubits"])
+    state = [_BASIS] * num_qubits
+    # Qubits measured in X basis and not touched since. They are assumed to be
+    # reset, so X applied to them is a reset fixup.
+    measured_x = set()
+    gates = []
+
+    def check_basis(qubits, gate):
+        for q in qubits:
+            if state[q] != _BASIS:
+                raise NotClassicalError(f"{gate} is controlled by qubit in superposition.")
+
+    for column in circuit["componentGrid"]:
+        for comp in column["components"]:
+            kind, gate = comp["kind"], comp["gate"]
+            if kind == "ket":
+                for q in _qubits(comp["targets"]):
+                    state[q] = _BASIS
+                    gates.append((RESET, q))
+                continue
+            if kind == "measurement":
+                for q in _qubits(comp["qubits"]):
+                    if state[q] == _BASIS:
+                        gates.append((MEASURE, q))
+                    else:
+                        gates.append((MEASURE_X, q))
+                        state[q] = _BASIS
+                        measured_x.add(q)
+                continue
+            assert kind == "unitary", f"Unexpected component: {comp}"
+            targets = _qubits(comp["targets"])
+            controls = _qubits(comp.get("controls", []))
+            if gate == "X" and len(controls) == 0 and targets[0] in measured_x:
+                measured_x.discard(targets[0])
+                continue
+            measured_x.difference_update(targets + controls)
+
+            if gate == "H" and len(controls) == 0:
+                (t,) = targets
+                state[t] = {_BASIS: _HADAMARD, _HADAMARD: _BASIS}.get(state[t], _MIXED)
+            elif gate in ("X", "Y"):
+                check_basis(controls, gate)
+                (t,) = targets
+                if state[t] == _BASIS:
+                    gates.append(_controlled_x(controls, t))
+                # Otherwise it only changes phase of X-basis state.
+            elif gate == "Z":
+                # Multi-controlled Z is symmetric in its qubits. It flips X-basis
+                # state of a qubit in HADAMARD state, if other qubits are ones.
+                qubits = controls + targets
+                in_x_basis = [q for q in qubits if state[q] != _BASIS]
+                if len(in_x_basis) > 1 or any(state[q] == _MIXED for q in in_x_basis):
+                    raise NotClassicalError("Z entangles qubits in superposition.")
+                if len(in_x_basis) == 1:
+                    t = in_x_basis[0]
+                    gates.append(_controlled_x([q for q in qubits if q != t], t))
+            elif gate in _PHASE_GATES:
+                for q in controls + targets:
+                    if state[q] != _BASIS:
+                        state[q] = _MIXED
+            elif gate == "Rx" and len(controls) == 0:
+                (t,) = targets
+                k = float(comp["args"][0])
+                if state[t] != _BASIS or k < 1 or k != int(k):
+                    raise NotClassicalError("Rx rotation is not a marker.")
+                gates.append((READ, int(k) - 1, t))
+            elif gate == "SWAP":
+                check_basis(controls, gate)
+                t1, t2 = targets
+                state[t1], state[t2] = state[t2], state[t1]
+                if len(controls) == 0:
+                    gates.append((SWAP, t1, t2))
+                else:
+                    check_basis(targets, gate)
+                    gates.append((CSWAP, tuple(controls), t1, t2))
+            else:
+                raise NotClassicalError(f"Unsupported gate: {gate}.")
+    return gates, num_qubits
+
+
+def pack_lanes(values: list[int], size: int) -> list[int]:
+    """Packs integers into bit-planes.
+
+    Returns `size` integers, where bit i of the j-th integer is bit j of values[i].
+    """
+    columns = [format(v, f"0{size}b") for v in reversed(values)]
+    planes = [int("".join(row), 2) if row else 0 for row in zip(*columns)]
+    return (planes[::-1] + [0] * size)[:size]
+
+
+def unpack_lanes(planes: list[int], count: int) -> list[int]:
+    """Inverse of `pack_lanes`, returns `count` integers."""
+    if len(planes) == 0:
+        return [0] * count
+    if len(planes) <= 32:
+        # Spread each plane to 4 bytes per lane, add them up shifted, and read
+        # the sum as array of 32-bit integers.
+        total = 0
+        for j, plane in enumerate(planes):
+            spread = format(plane, f"0{count}b")[::-1].encode("utf-32-be")
+            total += int.from_bytes(spread.translate(_ASCII_BIT), "big") << j
+        ans = array("I", total.to_bytes(4 * count, "big"))
+        if sys.byteorder == "little":
+            ans.byteswap()
+        return ans.tolist()
+    rows = [format(p, f"0{count}b")[::-1] for p in reversed(planes)]
+    return [int("".join(column), 2) for column in zip(*rows)]
+
+
+def exhaustive_lanes(num_bits: int) -> list[int]:
+    """Bit-planes of all integers in range [0, 2^num_bits), in increasing order."""
+    count = 1 << num_bits
+    planes = []
+    for j in range(num_bits):
+        # Period of bit j is 2^(j+1): 2^j zeros followed by 2^j ones.
+        plane, width = ((1 << (1 << j)) - 1) << (1 << j), 2 << j
+        while width < count:
+            plane |= plane << width
+            width *= 2
+        planes.append(plane)
+    return planes
+
+
+def simulate(
+    gates: list[tuple], num_qubits: int, bits: list[int], mask: int = 1
+) -> tuple[list, dict[int, int]]:
+    """Applies gates to classical bits.
+
+    Each bit is an integer holding independent lanes (one per input), so many
+    inputs are processed at once with bitwise operations. `mask` has ones in all
+    lanes.
+
+    Returns outcomes of measurements, and bits read by READ gates. Outcomes of
+    measurements in X basis are random, they are returned as None.
+    """
+    bits = bits + [0] * (num_qubits - len(bits))
+    outcomes = []
+    result = {}
+    for gate in gates:
+        op = gate[0]
+        if op == CX:
+            bits[gate[2]] ^= bits[gate[1]]
+        elif op == CCX:
+            bits[gate[3]] ^= bits[gate[1]] & bits[gate[2]]
+        elif op == X:
+            bits[gate[1]] ^= mask
+        elif op == MCX:
+            ctrl = mask
+            for c in gate[1]:
+                ctrl &= bits[c]
+            bits[gate[2]] ^= ctrl
+        elif op == SWAP:
+            bits[gate[1]], bits[gate[2]] = bits[gate[2]], bits[gate[1]]
+        elif op == CSWAP:
+            diff = bits[gate[2]] ^ bits[gate[3]]
+            for c in gate[1]:
+                diff &= bits[c]
+            bits[gate[2]] ^= diff
+            bits[gate[3]] ^= diff
+        elif op == MEASURE:
+            outcomes.append(bits[gate[1]])
+        elif op == MEASURE_X:
+            outcomes.append(None)
+            bits[gate[1]] = 0
+        elif op == RESET:
+            bits[gate[1]] = 0
+        elif op == READ:
+            result[gate[1]] = bits[gate[2]]
+    return outcomes, result
+
+
+class ClassicalOpSimulator:
+    """Simulates operation on registers of fixed sizes classically.
+
+    `trace_callable` must call `TestUtils.TraceArithmeticOp` for the operation.
+    Measurements in the middle of the circuit must give the same outcomes as
+    during tracing, otherwise TraceMismatchError is raised, because gates
+    applied after them may depend on the outcome.
+    """
+
+    def __init__(self, context, trace_callable, arg_sizes: list[int]):
+        self.arg_sizes = arg_sizes
+        circuit = context.circuit(
+            trace_callable,
+            generation_method=CircuitGenerationMethod.Simulate,
+            max_operations=2**62,
+            group_by_scope=False,
+        )
+        self.gates, self.num_qubits = compile_circuit(circuit.json())
+        self.traced_outcomes, result = simulate(self.gates, self.num_qubits, [])
+        if sorted(result.keys()) != list(range(sum(arg_sizes))):
+            raise NotClassicalError("Result bits are not marked.")
+
+    def run_sliced(self, planes: list[int], mask: int) -> tuple[list[int], int]:
+        """Runs the circuit on bit-planes of all input registers at once.
+
+        Returns bit-planes of the result, and mask of lanes in which
+        measurement outcomes differ from trace (results there are not valid).
+        """
+        outcomes, result = simulate(self.gates, self.num_qubits, planes, mask)
+        mismatch = 0
+        for outcome, traced in zip(outcomes, self.traced_outcomes):
+            if outcome is not None:
+                mismatch |= outcome ^ (mask if traced else 0)
+        return [result[k] for k in range(len(result))], mismatch
+
+    def run_batch(self, batch: list[list[int]]) -> list[list[int] | None]:
+        """Runs the circuit on many inputs at once, using one lane per input.
+
+        Returns None for inputs where trace is not valid.
+        """
+        count = len(batch)
+        planes = []
+        for i, size in enumerate(self.arg_sizes):
+            assert all(0 <= args[i] < 2**size for args in batch)
+            planes += pack_lanes([args[i] for args in batch], size)
+        result, mismatch = self.run_sliced(planes, (1 << count) - 1)
+        regs, offset = [], 0
+        for size in self.arg_sizes:
+            regs.append(unpack_lanes(result[offset : offset + size], count))
+            offset += size
+        return [
+            None if (mismatch >> i) & 1 else [reg[i] for reg in regs]
+            for i in range(count)
+        ]
+
+    def run(self, args: list[int]) -> list[int]:
+        (ans,) = self.run_batch([args])
+        if ans is None:
+            raise TraceMismatchError("Measurement outcome differs from trace.")
+        return ans
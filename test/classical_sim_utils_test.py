@@ -0,0 +1,50 @@
+import random
+
+import pytest
+
+from classical_sim_utils import FALLBACKS, exhaustive_lanes, pack_lanes, unpack_lanes
+from test_utils import ArithmeticOpTester
+
+
+# Last `out_count` registers are outputs, initialized with zeros.
+@pytest.mark.parametrize(
+    "op,sizes,out_count",
+    [
+        ("QuantumArithmetic.CDKM2004.Add", [8, 8], 0),
+        ("QuantumArithmetic.GKDKH2021.Add_Mod2N", [8, 8, 8], 1),
+        ("QuantumArithmetic.LAInc.IncrementByFlip", [10], 0),
+        ("QuantumArithmetic.MCT2017.Multiply", [16, 16, 32], 1),
+        ("QuantumArithmetic.TMVH2019.Divide", [8, 7, 8], 1),
+        ("QuantumArithmetic.LYY2021.ModExpWindowed(_,_,7L,15L,2)", [4, 4], 1),
+    ],
+)
+def test_classical_matches_quantum(op: str, sizes: list[int], out_count: int):
+    in_sizes = sizes[: len(sizes) - out_count]
+    batch = [
+        [random.randint(0, 2**n - 1) for n in in_sizes] + [0] * out_count
+        for _ in range(10)
+    ]
+    classical = ArithmeticOpTester(op, sizes, classical=True)
+    quantum = ArithmeticOpTester(op, sizes, classical=False)
+    assert classical.run_batch(batch) == quantum.run_batch(batch)
+    assert classical.run(batch[0]) == quantum.run(batch[0])
+
+
+def test_fallback_for_rotations():
+    op = "QuantumArithmetic.AdditionStd.Add_QFT"
+    tester = ArithmeticOpTester(op, [4, 4])
+    assert tester.run_batch([[3, 5], [15, 1]]) == [[3, 8], [15, 0]]
+    assert tester.classical_sim is None
+    assert op in FALLBACKS
+
+
+@pytest.mark.parametrize("size", [0, 1, 7, 32, 33, 100])
+def test_pack_unpack_lanes(size: int):
+    values = [random.randint(0, 2**size - 1) for _ in range(77)]
+    planes = pack_lanes(values, size)
+    assert len(planes) == size
+    assert unpack_lanes(planes, len(values)) == values
+
+
+def test_exhaustive_lanes():
+    assert unpack_lanes(exhaustive_lanes(5), 32) == list(range(32))
@@ -0,0 +1,9 @@
+from classical_sim_utils import FALLBACKS
+
+
+def pytest_terminal_summary(terminalreporter):
+    """Reports ops which couldn't be simulated classically."""
+    if FALLBACKS:
+        terminalreporter.section("ops not simulated classically")
+        for op, reason in sorted(FALLBACKS.items()):
+            terminalreporter.write_line(f"{op}: {reason}")
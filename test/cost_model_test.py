@@ -0,0 +1,86 @@
+import os
+import sys
+
+import numpy as np
+import pandas as pd
+import pytest
+
+sys.path.append(os.path.join(os.path.dirname(__file__), "..", "resource_estimate"))
+import cost_model  # noqa: E402
+from re_utils import METRICS  # noqa: E402
+
+N_RANGE = [16, 24, 32, 48, 64, 96, 128, 192, 256]
+FORMULAS = {
+    "A.Linear": [lambda n: 2 * n + 3, lambda n: 40 * n, lambda n: 5 * n + 1, lambda n: 0.5 * n],
+    "B.Quadratic": [lambda n: n**2 + n, lambda n: 3 * n**2, lambda n: 7 * n, lambda n: n**2 / 100],
+}
+
+
+@pytest.fixture
+def results_dir(tmp_path, monkeypatch):
+    monkeypatch.chdir(tmp_path)
+    rows = [[op, n] + [f(n) for f in funcs] for op, funcs in FORMULAS.items() for n in N_RANGE]
+    # Too few points to fit, must be skipped.
+    rows += [["C.Sparse", n] + [1, 2, 3, 4] for n in N_RANGE[:4]]
+    os.makedirs("results")
+    pd.DataFrame(rows, columns=["op", "n"] + METRICS).to_csv("results/estimate_test.csv", index=False)
+    return tmp_path
+
+
+def test_fit_models(results_dir):
+    models = cost_model.fit_models("estimate_test")
+    assert set(models) == {(op, metric) for op in FORMULAS for metric in METRICS}
+    for op, funcs in FORMULAS.items():
+        for metric, f in zip(METRICS, funcs):
+            model = models[(op, metric)]
+            assert (model.min_n, model.max_n) == (16, 256)
+            assert model.max_rel_error < 1e-6
+            assert model.predict(512) == pytest.approx(f(512), rel=1e-6)
+
+
+def test_fit_models_min_n(results_dir):
+    models = cost_model.fit_models("estimate_test", min_n=32)
+    assert models[("A.Linear", METRICS[0])].min_n == 32
+    assert ("C.Sparse", METRICS[0]) not in models
+
+
+def test_plan_sweep(results_dir):
+    models = cost_model.fit_models("estimate_test")
+    # Model of one metric is not trusted, so all jobs of this op are run.
+    models[("B.Quadratic", METRICS[0])].max_rel_error = 0.5
+    jobs = [("A.Linear", n) for n in [16, 64, 100, 200, 300, 400, 512, 1024]]
+    jobs += [("B.Quadratic", 100), ("D.Unknown", 100)]
+    to_run, predicted = cost_model.plan_sweep(jobs, models, validate_every=3)
+
+    # n=1024 is beyond 2*max_n; every 3rd trusted job is estimated.
+    assert to_run == [
+        ("A.Linear", 100),
+        ("A.Linear", 400),
+        ("A.Linear", 1024),
+        ("B.Quadratic", 100),
+        ("D.Unknown", 100),
+    ]
+    assert sorted(predicted) == [("A.Linear", n) for n in [16, 64, 200, 300, 512]]
+    for (_, n), metrics in predicted.items():
+        expected = [f(n) for f in FORMULAS["A.Linear"]]
+        assert np.allclose(metrics, expected, rtol=1e-6)
+
+
+@pytest.fixture
+def qsharp_lib(monkeypatch):
+    monkeypatch.chdir(os.path.join(os.path.dirname(__file__), ".."))
+    import qsharp
+
+    qsharp.init(project_root="./lib/")
+
+
+@pytest.mark.parametrize("key", list(cost_model.CLOSED_FORMS))
+def test_check_closed_form(qsharp_lib, key):
+    assert cost_model.check_closed_form(*key, range(1, 9)) == []
+
+
+def test_check_closed_form_reports_mismatches(qsharp_lib, monkeypatch):
+    key = ("QuantumArithmetic.CDKM2004.Add", "RunBinaryOpInPlace", "numQubits")
+    wrong = cost_model.ClosedForm("2*n + 1", lambda n: 2 * n + 1)
+    monkeypatch.setitem(cost_model.CLOSED_FORMS, key, wrong)
+    assert cost_model.check_closed_form(*key, range(1, 4)) == [(1, 3, 2)]
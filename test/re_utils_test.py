@@ -0,0 +1,52 @@
+import os
+import sys
+
+import pytest
+
+sys.path.append(os.path.join(os.path.dirname(__file__), "..", "resource_estimate"))
+import re_utils  # noqa: E402
+from result_store import ResultStore  # noqa: E402
+
+ENTRY_POINT = "RunBinaryOpInPlace"
+OP = "QuantumArithmetic.CDKM2004.Add"
+COUNTS = {
+    "numQubits": 33,
+    "tCount": 0,
+    "rotationCount": 0,
+    "rotationDepth": 0,
+    "cczCount": 62,
+    "ccixCount": 0,
+    "measurementCount": 0,
+}
+
+
+@pytest.fixture
+def store(tmp_path, monkeypatch):
+    monkeypatch.chdir(tmp_path)
+    store = ResultStore(str(tmp_path / "results" / "results.sqlite"))
+    monkeypatch.setattr(re_utils, "_STORE", store)
+    # Logical counts are cached, so the circuit is not traced.
+    store.put(f"logical_counts.{ENTRY_POINT}", OP, 16, COUNTS)
+    return store
+
+
+def test_logical_estimate_func_params_dont_share_results(store):
+    params1 = {"qubitParams": {"name": "qubit_gate_ns_e3"}}
+    params2 = {"qubitParams": {"name": "qubit_maj_ns_e6"}, "errorBudget": 0.01}
+    func1 = re_utils.logical_estimate_func(ENTRY_POINT, params1)
+    func2 = re_utils.logical_estimate_func(ENTRY_POINT, params2)
+    assert func1.__name__ != func2.__name__
+    assert func1.__name__ != re_utils.logical_estimate_func(ENTRY_POINT).__name__
+    # Name doesn't depend on order of keys.
+    same = re_utils.logical_estimate_func(ENTRY_POINT, dict(reversed(params2.items())))
+    assert same.__name__ == func2.__name__
+
+    metrics1 = re_utils.run_re_with_caching(func1, OP, 16)
+    metrics2 = re_utils.run_re_with_caching(func2, OP, 16)
+    assert metrics1 != metrics2
+    assert re_utils.run_re_with_caching(func1, OP, 16) == metrics1
+
+
+def test_logical_estimate_func_explicit_name(store):
+    func = re_utils.logical_estimate_func(ENTRY_POINT, {"errorBudget": 0.01}, name="my_estimate")
+    assert func.__name__ == "my_estimate"
@@ -0,0 +1,51 @@
+import os
+import sys
+
+import pandas as pd
+import pytest
+
+sys.path.append(os.path.join(os.path.dirname(__file__), "..", "resource_estimate"))
+import re_utils  # noqa: E402
+from result_store import ResultStore  # noqa: E402
+
+METRICS = ["Logical qubits", "Physical qubits", "Logical depth", "Runtime (seconds)"]
+
+
+def estimate_test(op, n):
+    raise AssertionError("Estimate must be taken from the store.")
+
+
+def _write_csv(file_name, rows):
+    os.makedirs(os.path.dirname(file_name), exist_ok=True)
+    pd.DataFrame(rows, columns=["op", "n"] + METRICS).to_csv(file_name, index=False)
+
+
+@pytest.fixture
+def store(tmp_path, monkeypatch):
+    monkeypatch.chdir(tmp_path)
+    store = ResultStore(str(tmp_path / "results" / "results.sqlite"))
+    monkeypatch.setattr(re_utils, "_STORE", store)
+    return store
+
+
+def test_export_keeps_rows_only_in_csv(store):
+    file_name = "results/estimate_test.csv"
+    store.put("estimate_test", "A.Op", 8, [1, 2, 3, 4.0])
+    _write_csv(file_name, [["B.Op", 8, 5, 6, 7, 8.0], ["A.Op", 8, 9, 9, 9, 9.0]])
+
+    # Database isn't empty, but rows from CSV must still be visible.
+    assert re_utils.run_re_with_caching(estimate_test, "B.Op", 8) == [5, 6, 7, 8.0]
+    assert re_utils.run_re_with_caching(estimate_test, "A.Op", 8) == [1, 2, 3, 4.0]
+
+    re_utils.export_results(estimate_test)
+    df = pd.read_csv(file_name)
+    assert df.values.tolist() == [["A.Op", 8, 1, 2, 3, 4.0], ["B.Op", 8, 5, 6, 7, 8.0]]
+
+
+def test_export_csv_merges_existing_file(store):
+    file_name = "results/estimate_test.csv"
+    _write_csv(file_name, [["B.Op", 16, 5, 6, 7, 8.0]])
+    store.put("estimate_test", "A.Op", 16, [1, 2, 3, 4.0])
+    store.export_csv("estimate_test", file_name, METRICS)
+    df = pd.read_csv(file_name)
+    assert df.values.tolist() == [["A.Op", 16, 1, 2, 3, 4.0], ["B.Op", 16, 5, 6, 7, 8.0]]
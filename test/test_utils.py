@@ -1,8 +1,17 @@
 import math
 import random
+import time
 
 import qdk
 
+from classical_sim_utils import (
+    FALLBACKS,
+    ClassicalOpSimulator,
+    NotClassicalError,
+    exhaustive_lanes,
+    unpack_lanes,
+)
+
 CONTEXT = qdk.Context(project_root="./lib/")
 
 
@@ -15,23 +24,132 @@ def random_coprime(N):
 
 
 class ArithmeticOpTester:
-    """Tests arithmetic operation with fixed register sizes on many inputs."""
+    """Tests arithmetic operation with fixed register sizes on many inputs.
+
+    `run` makes one simulator call per input. `run_batch` evaluates many inputs
+    in a single call, and records its wall time in `last_batch_time`.
+
+    If `classical` is None, `run_batch` simulates the circuit classically when
+    it consists only of reversible gates (see `classical_sim_utils`), and falls
+    back to the quantum simulator otherwise. If `classical` is True, both `run`
+    and `run_batch` must use classical simulation. If False, it's never used.
+    """
 
-    def __init__(self, op: str, arg_sizes: int):
+    def __init__(self, op: str, arg_sizes: int, classical: bool | None = None):
+        self.op = op
+        self.arg_sizes = arg_sizes
+        self.classical = classical
+        self.classical_sim = None
         self.arity = len(arg_sizes)
         args_expanded = ",".join(f"r[{i}]" for i in range(self.arity))
-        op1 = f"r=>{op}({args_expanded})"
+        self.op1 = f"r=>{op}({args_expanded})"
 
         CONTEXT.eval(f"""
         operation _RunOpOnInputs(inputs: BigInt[]) : BigInt[] {{
-            return TestUtils.TestArithmeticOp({op1},{arg_sizes},inputs);           
+            return TestUtils.TestArithmeticOp({self.op1},{arg_sizes},inputs);           
         }}
         """)
         self.test_callable = CONTEXT.code._RunOpOnInputs
+        self.batch_callable = None
+        self.last_batch_time = None
+
+    def _get_batch_callable(self):
+        if self.batch_callable is None:
+            CONTEXT.eval(f"""
+            operation _RunOpOnInputsBatch(batch: BigInt[][]) : BigInt[][] {{
+                return TestUtils.TestArithmeticOpBatch({self.op1},{self.arg_sizes},batch);
+            }}
+            """)
+            self.batch_callable = CONTEXT.code._RunOpOnInputsBatch
+        return self.batch_callable
+
+    def _get_classical_sim(self) -> ClassicalOpSimulator | None:
+        """Traces the op for classical simulation, if it wasn't done yet."""
+        if self.classical is False or self.op in FALLBACKS:
+            return None
+        if self.classical_sim is None:
+            CONTEXT.eval(f"""
+            operation _TraceOp() : Unit {{
+                TestUtils.TraceArithmeticOp({self.op1},{self.arg_sizes});
+            }}
+            """)
+            try:
+                self.classical_sim = ClassicalOpSimulator(
+                    CONTEXT, CONTEXT.code._TraceOp, self.arg_sizes
+                )
+            except NotClassicalError as e:
+                FALLBACKS[self.op] = str(e)
+                if self.classical:
+                    raise
+        return self.classical_sim
+
+    def _run_classical(
+        self, sim: ClassicalOpSimulator, batch: list[list[int]]
+    ) -> list[list[int]]:
+        results = sim.run_batch(batch)
+        # Where control flow depends on measurements, re-run input on simulator.
+        return [
+            self.test_callable(args) if ans is None else ans
+            for args, ans in zip(batch, results)
+        ]
 
     def run(self, args: list[int]) -> list[int]:
+        if self.classical:
+            return self._run_classical(self._get_classical_sim(), [args])[0]
         return self.test_callable(args)
 
+    def run_batch(self, batch: list[list[int]]) -> list[list[int]]:
+        """Runs the operation on each input vector, in one simulator call."""
+        assert all(len(args) == self.arity for args in batch)
+        t0 = time.perf_counter()
+        sim = self._get_classical_sim()
+        if sim is not None:
+            results = self._run_classical(sim, batch)
+        else:
+            results = self._get_batch_callable()(batch)
+        self.last_batch_time = time.perf_counter() - t0
+        return results
+
+    def run_exhaustive(
+        self, args: list[int | None]
+    ) -> tuple[list[list[int]], list[list[int]]]:
+        """Runs the operation on all values of registers where args[i] is None.
+
+        Other registers are set to args[i]. All inputs are simulated at once on
+        bit-planes, so the circuit must be classically simulatable. Returns
+        inputs and results, as lists of values for each register. Inputs are
+        enumerated in increasing order, first register being least significant.
+        """
+        assert len(args) == self.arity
+        t0 = time.perf_counter()
+        sim = self._get_classical_sim()
+        assert sim is not None, f"{self.op} can't be simulated classically."
+        num_bits = sum(sz for a, sz in zip(args, self.arg_sizes) if a is None)
+        count = 1 << num_bits
+        mask = (1 << count) - 1
+        lanes = exhaustive_lanes(num_bits)
+        planes, inputs, offset = [], [], 0
+        for val, size in zip(args, self.arg_sizes):
+            if val is None:
+                planes += lanes[offset : offset + size]
+                inputs.append(unpack_lanes(lanes[offset : offset + size], count))
+                offset += size
+            else:
+                planes += [mask if (val >> j) & 1 else 0 for j in range(size)]
+                inputs.append([val] * count)
+        result, mismatch = sim.run_sliced(planes, mask)
+        results, offset = [], 0
+        for size in self.arg_sizes:
+            results.append(unpack_lanes(result[offset : offset + size], count))
+            offset += size
+        for i in range(count):
+            if (mismatch >> i) & 1:
+                ans = self.test_callable([reg[i] for reg in inputs])
+                for reg, val in zip(results, ans):
+                    reg[i] = val
+        self.last_batch_time = time.perf_counter() - t0
+        return inputs, results
+
 
 def run_op(op: str, arg_sizes: list[int], args: list[int]) -> list[int]:
     return ArithmeticOpTester(op, arg_sizes).run(args)
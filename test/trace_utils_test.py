@@ -0,0 +1,53 @@
+import os
+import sys
+
+import pytest
+
+sys.path.append(os.path.join(os.path.dirname(__file__), "..", "resource_estimate"))
+import trace_utils  # noqa: E402
+
+ADDERS = ["QuantumArithmetic.CDKM2004.Add", "QuantumArithmetic.TR2013.Add"]
+
+
+@pytest.fixture
+def traces_dir(tmp_path, monkeypatch):
+    trace_utils.qsharp.init(project_root="./lib/")
+    monkeypatch.setattr(trace_utils, "TRACES_DIR", str(tmp_path))
+    return tmp_path
+
+
+def test_trace_with_caching_round_trip(traces_dir, monkeypatch):
+    trace = trace_utils.trace_with_caching("RunBinaryOpInPlace", ADDERS[0], 4)
+    files = list(traces_dir.rglob("*.npy"))
+    assert len(files) == 1
+    assert trace_utils.toffoli_count(trace) > 0
+
+    def fail(_):
+        raise AssertionError("Cached trace was recorded again.")
+
+    monkeypatch.setattr(trace_utils, "record_trace", fail)
+    cached = trace_utils.trace_with_caching("RunBinaryOpInPlace", ADDERS[0], 4)
+    assert cached.dtype == trace.dtype
+    assert cached.tobytes() == trace.tobytes()  # NaN angles are equal here.
+
+
+def test_trace_with_caching_distinct_namespaces(traces_dir):
+    # Both ops are called "Add", and must not share a cache file.
+    traces = [trace_utils.trace_with_caching("RunBinaryOpInPlace", op, 4) for op in ADDERS]
+    assert len(list(traces_dir.rglob("*.npy"))) == 2
+    assert trace_utils.gate_counts(traces[0]) != trace_utils.gate_counts(traces[1])
+
+
+@pytest.mark.parametrize(
+    "expr1,expr2",
+    [
+        ("EstimateUtils.RunMultiply(8,A.B.Mul)", "EstimateUtils.RunMultiply(8,C.B.Mul)"),
+        ("EstimateUtils.RunMultiply(8,A.B_C)", "EstimateUtils.RunMultiply(8,A.B.C)"),
+        ("EstimateUtils.RunMultiply(8,Op)", "EstimateUtils.RunMultiply(16,Op)"),
+    ],
+)
+def test_trace_file_name_unique(expr1: str, expr2: str):
+    name1 = trace_utils.trace_file_name("RunMultiply", expr1)
+    name2 = trace_utils.trace_file_name("RunMultiply", expr2)
+    assert name1 != name2
+    assert name1 == trace_utils.trace_file_name("RunMultiply", expr1)
@@ -0,0 +1,38 @@
+import os
+import sys
+import warnings
+
+import pytest
+
+sys.path.append(os.path.join(os.path.dirname(__file__), "..", "resource_estimate"))
+import window_tuner  # noqa: E402
+
+
+@pytest.fixture
+def qsharp_lib(monkeypatch):
+    monkeypatch.chdir(os.path.join(os.path.dirname(__file__), ".."))
+    window_tuner.qsharp.init(project_root="./lib/")
+
+
+def test_tune_warns_if_extrapolated(qsharp_lib):
+    with warnings.catch_warnings():
+        warnings.simplefilter("error")
+        window_tuner.tune("LYY2021", 16, "t_count")
+    with pytest.warns(UserWarning, match="fitted for n=8..32"):
+        window_tuner.tune("CG20192", 256, "t_count")
+
+
+def test_tune_uses_range_of_given_model(qsharp_lib):
+    model = {
+        "TCount": [1.396652e01, 1.468514e02, -1.840172e02],
+        "Depth": [7.981572e00, 6.294967e01, -7.925046e01],
+        "Ancillas": [2.0, 2.0, 4.0],
+        "MinN": 8,
+        "MaxN": 64,
+    }
+    assert "MinN = 8, MaxN = 64" in window_tuner.model_to_qsharp(model)
+    with warnings.catch_warnings():
+        warnings.simplefilter("error")
+        window_tuner.tune("LYY2021", 64, "t_count", model=model)
+    with pytest.warns(UserWarning, match="fitted for n=8..64"):
+        window_tuner.tune("LYY2021", 128, "t_count", model=model)